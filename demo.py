@@ -6,13 +6,18 @@ This version uses mock data and doesn't require PostgreSQL or Redis
 
 import asyncio
 import json
+import logging
+import os
 import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import random
 import math
+from collections import Counter, OrderedDict
+
+logger = logging.getLogger(__name__)
 
 # Mock data for demonstration
 MOCK_SITES = [
@@ -55,6 +60,13 @@ MOCK_SITES = [
     }
 ]
 
+# Column layout of MOCK_SITES for aggregate statistics
+MOCK_SITE_COLUMNS = {
+    "project_type": tuple(site["project_type"] for site in MOCK_SITES),
+    "overall_score": tuple(site["overall_score"] for site in MOCK_SITES),
+    "estimated_capacity_mw": tuple(site["estimated_capacity_mw"] for site in MOCK_SITES),
+}
+
 @dataclass
 class SiteAnalysisRequest:
     location: Dict[str, float]
@@ -76,13 +88,51 @@ class SiteAnalysisResult:
     estimated_capacity_mw: float
     analysis_timestamp: datetime
 
+# Completed site analyses kept per GeoSparkDemo for repeat probes of the same site
+SITE_RESULT_CACHE_SIZE = 4096
+
+# (low, high) bounds of the uniform draws analyze_site makes, in draw order
+SITE_DRAW_BOUNDS = (
+    (1200, 2500), (4.5, 7.0), (0.22, 0.35),  # irradiance, peak sun hours, solar CF
+    (-0.2, 0.3), (5.0, 12.0), (0.25, 0.45),  # wind score offset, wind speed, wind CF
+    (0.6, 0.95), (0.5, 0.9), (0.7, 0.95),    # environmental, regulatory, accessibility
+    (0.0, 1.0),                              # capacity density, scaled per project type
+)
+
+# Overall score weights over (solar, wind, environmental, regulatory, accessibility)
+OVERALL_SCORE_WEIGHTS = {
+    "solar": ((1, 0, 1, 1, 1), 4),
+    "wind": ((0, 1, 1, 1, 1), 4),
+    "hybrid": ((1, 1, 1, 1, 1), 5),
+}
+
+# Formatted "now" shared by status-style fields, refreshed at most once a second
+_now_iso_cache = [0.0, ""]
+
+def now_iso() -> str:
+    """Current local time as an ISO string, cached for up to one second"""
+    t = time.time()
+    if t - _now_iso_cache[0] >= 1.0:
+        _now_iso_cache[0] = t
+        _now_iso_cache[1] = datetime.fromtimestamp(t).isoformat()
+    return _now_iso_cache[1]
+
+# Artificial service latency is off by default; set GEOSPARK_SIMULATE_LATENCY=1
+# to make the mock services behave like slow remote APIs again
+SIMULATE_LATENCY = os.getenv("GEOSPARK_SIMULATE_LATENCY", "0") == "1"
+
+async def simulate_latency(seconds: float):
+    """Sleep only when simulated latency is enabled"""
+    if SIMULATE_LATENCY:
+        await asyncio.sleep(seconds)
+
 class MockLLMService:
     """Mock LLM service for demo purposes"""
     
     @staticmethod
     async def analyze_text(text: str, analysis_type: str = "general") -> Dict[str, Any]:
         """Mock text analysis"""
-        await asyncio.sleep(0.1)  # Simulate API call
+        await simulate_latency(0.1)  # Simulate API call
         
         return {
             "analysis_type": analysis_type,
@@ -95,7 +145,7 @@ class MockLLMService:
     @staticmethod
     async def generate_recommendations(site_data: Dict[str, Any]) -> List[str]:
         """Generate mock recommendations"""
-        await asyncio.sleep(0.2)
+        await simulate_latency(0.2)
         
         recommendations = [
             "Consider implementing advanced tracking systems for optimal energy capture",
@@ -110,7 +160,7 @@ class MockLLMService:
     @staticmethod
     async def identify_risks(site_data: Dict[str, Any]) -> List[str]:
         """Identify mock risks"""
-        await asyncio.sleep(0.15)
+        await simulate_latency(0.15)
         
         risks = [
             "Potential weather-related disruptions",
@@ -128,7 +178,7 @@ class MockNLPService:
     @staticmethod
     async def extract_entities(text: str) -> Dict[str, List[str]]:
         """Extract mock entities"""
-        await asyncio.sleep(0.05)
+        await simulate_latency(0.05)
         
         return {
             "locations": ["Texas", "California", "Nevada"],
@@ -140,7 +190,7 @@ class MockNLPService:
     @staticmethod
     async def summarize_text(text: str) -> str:
         """Generate mock summary"""
-        await asyncio.sleep(0.1)
+        await simulate_latency(0.1)
         
         return f"Summary: This text discusses renewable energy projects with focus on {random.choice(['solar', 'wind', 'hybrid'])} technologies."
 
@@ -153,17 +203,19 @@ class MockIRService:
             {"id": "2", "content": "Wind resources in California coastal areas", "metadata": {"type": "wind"}},
             {"id": "3", "content": "Hybrid renewable energy systems", "metadata": {"type": "hybrid"}},
         ]
+        # Lowercased once here instead of per document per query word
+        self._searchable = [(doc, doc["content"].lower()) for doc in self.documents]
     
     async def search_documents(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Mock document search"""
-        await asyncio.sleep(0.1)
+        await simulate_latency(0.1)
         
         # Simple keyword matching
         results = []
-        query_lower = query.lower()
+        query_words = query.lower().split()
         
-        for doc in self.documents:
-            if any(word in doc["content"].lower() for word in query_lower.split()):
+        for doc, content_lower in self._searchable:
+            if any(word in content_lower for word in query_words):
                 results.append({
                     "id": doc["id"],
                     "content": doc["content"],
@@ -181,13 +233,65 @@ class GeoSparkDemo:
         self.nlp_service = MockNLPService()
         self.ir_service = MockIRService()
         self.analysis_history = []
+        self._rng = random.Random()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._site_results: "OrderedDict[tuple, SiteAnalysisResult]" = OrderedDict()
     
     async def analyze_site(self, request: SiteAnalysisRequest) -> SiteAnalysisResult:
-        """Perform comprehensive site analysis"""
-        print(f"🔍 Analyzing site at {request.location['latitude']:.4f}, {request.location['longitude']:.4f}")
+        """Perform comprehensive site analysis
+        
+        Results are memoized on the rounded location, area and project type;
+        a repeat probe gets the cached analysis with a fresh site_id and
+        timestamp. Concurrent requests for the same key share one in-flight
+        analysis instead of each running their own.
+        """
+        key = (
+            round(request.location["latitude"], 3),
+            round(request.location["longitude"], 3),
+            round(request.location.get("area_km2", 100), 2),
+            request.project_type,
+        )
+        cached = self._site_results.get(key)
+        if cached is not None:
+            self._site_results.move_to_end(key)
+            return self._repeat_site_analysis(cached, request)
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_site_analysis(request))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_site_analysis(key, done))
+            # Shield so one caller cancelling does not cancel the shared analysis
+            return await asyncio.shield(task)
+        # Joiners get their own copy of the shared result, like cache hits
+        return self._repeat_site_analysis(await asyncio.shield(task), request)
+    
+    def _repeat_site_analysis(self, result: SiteAnalysisResult, request: SiteAnalysisRequest) -> SiteAnalysisResult:
+        """Reissue a shared analysis for another request and record it in history"""
+        repeat = replace(
+            result,
+            site_id=str(uuid.uuid4()),
+            location=request.location,
+            analysis_timestamp=datetime.now()
+        )
+        self.analysis_history.append(repeat)
+        return repeat
+    
+    def _finish_site_analysis(self, key: tuple, task: asyncio.Future):
+        """Retire an in-flight analysis and remember its result"""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._site_results[key] = task.result()
+        if len(self._site_results) > SITE_RESULT_CACHE_SIZE:
+            self._site_results.popitem(last=False)
+    
+    async def _run_site_analysis(self, request: SiteAnalysisRequest) -> SiteAnalysisResult:
+        """Run a single site analysis"""
+        logger.info("🔍 Analyzing site at %.4f, %.4f", request.location["latitude"], request.location["longitude"])
         
         # Simulate analysis time
-        await asyncio.sleep(1.0)
+        await simulate_latency(1.0)
         
         # Generate mock analysis results
         site_id = str(uuid.uuid4())
@@ -196,35 +300,33 @@ class GeoSparkDemo:
         lat = request.location["latitude"]
         lng = request.location["longitude"]
         
+        # Draw every random value for this analysis in one pass
+        rand = self._rng.random
+        (irradiance, sun_hours, solar_cf, wind_offset, wind_speed, wind_cf,
+         environmental_score, regulatory_score, accessibility_score,
+         capacity_draw) = [low + (high - low) * rand() for low, high in SITE_DRAW_BOUNDS]
+        
         # Solar potential (higher in southern latitudes)
         solar_score = max(0.3, min(0.95, 0.7 + (30 - abs(lat)) * 0.01))
         solar_potential = {
-            "annual_irradiance_kwh_m2": random.uniform(1200, 2500),
-            "peak_sun_hours": random.uniform(4.5, 7.0),
-            "capacity_factor": random.uniform(0.22, 0.35),
+            "annual_irradiance_kwh_m2": irradiance,
+            "peak_sun_hours": sun_hours,
+            "capacity_factor": solar_cf,
             "solar_score": solar_score
         }
         
         # Wind potential (mock calculation)
-        wind_score = max(0.2, min(0.9, 0.5 + random.uniform(-0.2, 0.3)))
+        wind_score = max(0.2, min(0.9, 0.5 + wind_offset))
         wind_potential = {
-            "average_wind_speed_ms": random.uniform(5.0, 12.0),
-            "capacity_factor": random.uniform(0.25, 0.45),
+            "average_wind_speed_ms": wind_speed,
+            "capacity_factor": wind_cf,
             "wind_score": wind_score
         }
         
-        # Other scores
-        environmental_score = random.uniform(0.6, 0.95)
-        regulatory_score = random.uniform(0.5, 0.9)
-        accessibility_score = random.uniform(0.7, 0.95)
-        
-        # Overall score
-        if request.project_type == "solar":
-            overall_score = (solar_score + environmental_score + regulatory_score + accessibility_score) / 4
-        elif request.project_type == "wind":
-            overall_score = (wind_score + environmental_score + regulatory_score + accessibility_score) / 4
-        else:  # hybrid
-            overall_score = (solar_score + wind_score + environmental_score + regulatory_score + accessibility_score) / 5
+        # Overall score (unknown project types are scored as hybrid)
+        weights, denominator = OVERALL_SCORE_WEIGHTS.get(request.project_type, OVERALL_SCORE_WEIGHTS["hybrid"])
+        scores = (solar_score, wind_score, environmental_score, regulatory_score, accessibility_score)
+        overall_score = sum(w * score for w, score in zip(weights, scores)) / denominator
         
         # Generate recommendations and risks
         site_data = {
@@ -234,17 +336,19 @@ class GeoSparkDemo:
             "wind_potential": wind_potential
         }
         
-        recommendations = await self.llm_service.generate_recommendations(site_data)
-        risks = await self.llm_service.identify_risks(site_data)
+        recommendations, risks = await asyncio.gather(
+            self.llm_service.generate_recommendations(site_data),
+            self.llm_service.identify_risks(site_data),
+        )
         
         # Estimate capacity
         area_km2 = request.location.get("area_km2", 100)
         if request.project_type == "solar":
-            estimated_capacity_mw = area_km2 * random.uniform(0.2, 0.4)
+            estimated_capacity_mw = area_km2 * (0.2 + 0.2 * capacity_draw)
         elif request.project_type == "wind":
-            estimated_capacity_mw = area_km2 * random.uniform(0.1, 0.3)
+            estimated_capacity_mw = area_km2 * (0.1 + 0.2 * capacity_draw)
         else:  # hybrid
-            estimated_capacity_mw = area_km2 * random.uniform(0.15, 0.35)
+            estimated_capacity_mw = area_km2 * (0.15 + 0.2 * capacity_draw)
         
         result = SiteAnalysisResult(
             site_id=site_id,
@@ -268,12 +372,14 @@ class GeoSparkDemo:
     
     async def analyze_text(self, text: str, analysis_type: str = "general") -> Dict[str, Any]:
         """Analyze text using NLP"""
-        print(f"📝 Analyzing text: {text[:50]}...")
+        logger.info("📝 Analyzing text: %.50s...", text)
         
-        # Run NLP analysis
-        entities = await self.nlp_service.extract_entities(text)
-        summary = await self.nlp_service.summarize_text(text)
-        llm_analysis = await self.llm_service.analyze_text(text, analysis_type)
+        # Run the independent NLP analyses concurrently
+        entities, summary, llm_analysis = await asyncio.gather(
+            self.nlp_service.extract_entities(text),
+            self.nlp_service.summarize_text(text),
+            self.llm_service.analyze_text(text, analysis_type)
+        )
         
         return {
             "entities": entities,
@@ -284,7 +390,7 @@ class GeoSparkDemo:
     
     async def search_data(self, query: str) -> Dict[str, Any]:
         """Search renewable energy data"""
-        print(f"🔍 Searching for: {query}")
+        logger.info("🔍 Searching for: %s", query)
         
         # Search documents
         documents = await self.ir_service.search_documents(query)
@@ -297,7 +403,7 @@ class GeoSparkDemo:
             "documents": documents,
             "query_analysis": query_analysis,
             "total_results": len(documents),
-            "search_timestamp": datetime.now().isoformat()
+            "search_timestamp": now_iso()
         }
     
     def get_system_status(self) -> Dict[str, Any]:
@@ -311,24 +417,30 @@ class GeoSparkDemo:
             "llm_providers": ["mock_openai", "mock_anthropic"],
             "database_status": "mock",
             "redis_status": "mock",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     
     def get_data_statistics(self) -> Dict[str, Any]:
         """Get data statistics"""
+        type_counts = Counter(MOCK_SITE_COLUMNS["project_type"])
+        scores = MOCK_SITE_COLUMNS["overall_score"]
         return {
             "total_sites": len(MOCK_SITES),
             "total_analyses": len(self.analysis_history),
             "project_types": {
-                "solar": len([s for s in MOCK_SITES if s["project_type"] == "solar"]),
-                "wind": len([s for s in MOCK_SITES if s["project_type"] == "wind"]),
-                "hybrid": len([s for s in MOCK_SITES if s["project_type"] == "hybrid"])
+                "solar": type_counts["solar"],
+                "wind": type_counts["wind"],
+                "hybrid": type_counts["hybrid"]
             },
-            "average_score": sum(s["overall_score"] for s in MOCK_SITES) / len(MOCK_SITES),
-            "total_capacity_mw": sum(s["estimated_capacity_mw"] for s in MOCK_SITES),
-            "timestamp": datetime.now().isoformat()
+            "average_score": sum(scores) / len(scores),
+            "total_capacity_mw": sum(MOCK_SITE_COLUMNS["estimated_capacity_mw"]),
+            "timestamp": now_iso()
         }
 
+async def ainput(prompt: str = "") -> str:
+    """Read a line from stdin without blocking the event loop"""
+    return await asyncio.to_thread(input, prompt)
+
 async def demo_interactive():
     """Interactive demo mode"""
     demo = GeoSparkDemo()
@@ -349,7 +461,7 @@ async def demo_interactive():
         print("6. View mock sites")
         print("0. Exit")
         
-        choice = input("\nEnter your choice (0-6): ").strip()
+        choice = (await ainput("\nEnter your choice (0-6): ")).strip()
         
         if choice == "0":
             print("👋 Goodbye!")
@@ -358,10 +470,10 @@ async def demo_interactive():
         elif choice == "1":
             print("\n📍 Site Analysis")
             try:
-                lat = float(input("Enter latitude: "))
-                lng = float(input("Enter longitude: "))
-                area = float(input("Enter area (km²) [default: 100]: ") or "100")
-                project_type = input("Project type (solar/wind/hybrid) [default: solar]: ").strip() or "solar"
+                lat = float(await ainput("Enter latitude: "))
+                lng = float(await ainput("Enter longitude: "))
+                area = float(await ainput("Enter area (km²) [default: 100]: ") or "100")
+                project_type = (await ainput("Project type (solar/wind/hybrid) [default: solar]: ")).strip() or "solar"
                 
                 request = SiteAnalysisRequest(
                     location={"latitude": lat, "longitude": lng, "area_km2": area},
@@ -382,8 +494,8 @@ async def demo_interactive():
         
         elif choice == "2":
             print("\n📝 Text Analysis")
-            text = input("Enter text to analyze: ")
-            analysis_type = input("Analysis type [default: general]: ").strip() or "general"
+            text = await ainput("Enter text to analyze: ")
+            analysis_type = (await ainput("Analysis type [default: general]: ")).strip() or "general"
             
             result = await demo.analyze_text(text, analysis_type)
             
@@ -394,7 +506,7 @@ async def demo_interactive():
         
         elif choice == "3":
             print("\n🔍 Data Search")
-            query = input("Enter search query: ")
+            query = await ainput("Enter search query: ")
             
             result = await demo.search_data(query)
             
@@ -444,11 +556,11 @@ async def demo_automated():
     ]
     
     print("\n📍 Running sample site analyses...")
-    for i, site_data in enumerate(sample_sites, 1):
-        print(f"\n{i}. Analyzing {site_data['project_type']} project...")
-        request = SiteAnalysisRequest(**site_data)
-        result = await demo.analyze_site(request)
-        
+    requests = [SiteAnalysisRequest(**site_data) for site_data in sample_sites]
+    results = await asyncio.gather(*(demo.analyze_site(request) for request in requests))
+
+    for i, (site_data, result) in enumerate(zip(sample_sites, results), 1):
+        print(f"\n{i}. Analyzed {site_data['project_type']} project")
         print(f"   Score: {result.overall_score:.1%}")
         print(f"   Capacity: {result.estimated_capacity_mw:.1f} MW")
         print(f"   Recommendations: {len(result.recommendations)}")
@@ -473,6 +585,9 @@ def main():
     """Main function"""
     import sys
     
+    # Show the services' progress messages on the console
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     if len(sys.argv) > 1 and sys.argv[1] == "--interactive":
         asyncio.run(demo_interactive())
     else:
@@ -0,0 +1,19 @@
+"""
+Gunicorn settings for serving the GeoSpark API in production
+Run this with: gunicorn -c gunicorn_conf.py main:app
+"""
+
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# main.py keeps recent activities, analysis history and result caches in process
+# memory, and registered users too unless USERS_REDIS_URL is set. Extra workers
+# would each see their own users, activities and stats, so keep one worker until
+# that state is externalised, then set WEB_CONCURRENCY (e.g. 2 * cores + 1).
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+keepalive = 5
+graceful_timeout = 30
+accesslog = None
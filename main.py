@@ -10,44 +10,131 @@ RECENT_ACTIVITIES: list[dict] = []
 
 
 
-import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, EmailStr
 from typing import Dict, Any, List, Optional
-import json
+import orjson
 import asyncio
+import importlib
+import logging
+import os
 from datetime import datetime
-import uuid
-import bcrypt
-import random
-import math
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from types import MappingProxyType
+import httpx
 
 # Import the demo functionality
-from demo import GeoSparkDemo
+from demo import GeoSparkDemo, SiteAnalysisRequest as DemoRequest, now_iso
 
 # Import Stripe routes
 from app.api.v1.stripe_routes import router as stripe_router
 
-# In-memory user DB
+logger = logging.getLogger(__name__)
+
+# In-memory user DB; set USERS_REDIS_URL to share users across workers instead
 USERS_DB: Dict[str, Dict] = {}
+USERS_REDIS_URL = os.getenv("USERS_REDIS_URL")
+
+# bcrypt work factor: each +1 doubles hashing time (12 is the library default)
+BCRYPT_COST = int(os.getenv("BCRYPT_COST", "12"))
+
+# Short-lived result caches: key -> (expires_at, value), oldest entry first
+GEOCODE_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+GEOCODE_CACHE_TTL = 3600
+GEOCODE_CACHE_SIZE = 256
+# Lookups currently in flight, so concurrent requests for a city share one call
+GEOCODE_INFLIGHT: Dict[str, asyncio.Future] = {}
+RESOURCE_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+RESOURCE_CACHE_TTL = 3600
+RESOURCE_CACHE_SIZE = 4096
+RESOURCE_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+# Encoded bodies for the mock search endpoint
+RESPONSE_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+SEARCH_CACHE_TTL = 300
+RESPONSE_CACHE_SIZE = 1024
+
+def _ttl_cache_get(cache: OrderedDict, key: Any) -> Any:
+    entry = cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        cache.move_to_end(key)
+        return entry[1]
+    return None
+
+def _ttl_cache_put(cache: OrderedDict, key: Any, value: Any, ttl: float, max_size: int) -> None:
+    cache[key] = (time.monotonic() + ttl, value)
+    cache.move_to_end(key)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
+# Heavy modules (pandas, geopandas, LLM SDKs) that request handlers import lazily
+PRELOAD_MODULES = (
+    "app.agents.communication",
+    "app.agents.resource_estimation",
+    "app.agents.site_selection",
+    "app.services.llm_service",
+)
+
+def _preload_modules() -> None:
+    """Import the lazily loaded modules up front so the first request doesn't pay for it"""
+    for module in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            # Leave it to the request path, which reports the failure per call
+            logger.warning("Could not preload %s", module, exc_info=True)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared HTTP client so outbound calls reuse pooled connections
+    app.state.http = httpx.AsyncClient(timeout=10, headers={"User-Agent": "geospark-demo"})
+    app.state.users_store = None
+    if USERS_REDIS_URL:
+        import redis.asyncio as aioredis
+        app.state.users_store = aioredis.from_url(USERS_REDIS_URL)
+    # Compute the login sentinel hash and load the heavy modules up front so no
+    # request pays for them
+    await asyncio.gather(
+        asyncio.to_thread(_dummy_password_hash),
+        asyncio.to_thread(_preload_modules)
+    )
+    yield
+    await app.state.http.aclose()
+    if app.state.users_store is not None:
+        await app.state.users_store.aclose()
 
 app = FastAPI(
     title="GeoSpark AI Analytics Platform",
     description="AI-powered renewable energy analysis platform - Professional Version",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
+# Add CORS middleware (explicit origins: a wildcard is not valid together with credentials)
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress large JSON responses (comprehensive reports carry multi-KB text and chart data)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include Stripe payment routes
 app.include_router(stripe_router, prefix="/api/v1")
 
@@ -74,6 +161,11 @@ class SiteAnalysisRequest(BaseModel):
     project_type: str = "solar"
     analysis_depth: str = "comprehensive"
 
+class SiteAnalysisBatchRequest(BaseModel):
+    locations: List[Location]
+    project_type: str = "solar"
+    analysis_depth: str = "comprehensive"
+
 class TextAnalysisRequest(BaseModel):
     text: str
     analysis_type: str = "general"
@@ -93,9 +185,19 @@ class ResourceEstimationRequest(BaseModel):
     resource_type: str = "solar"
     system_config: Dict[str, Any] = {}
 
+class ProjectData(BaseModel):
+    project_type: str = "solar"
+    capacity_mw: float = 100
+    annual_generation_gwh: float = 200
+
+class FinancialParams(BaseModel):
+    electricity_price_usd_mwh: float = 50
+    project_lifetime: int = 25
+    discount_rate: float = 0.08
+
 class CostEvaluationRequest(BaseModel):
-    project_data: Dict[str, Any]
-    financial_params: Dict[str, Any] = {}
+    project_data: ProjectData
+    financial_params: FinancialParams = FinancialParams()
 
 class AgentChatRequest(BaseModel):
     message: str
@@ -104,7 +206,8 @@ class AgentChatRequest(BaseModel):
     mode: str | None = None  # 'workflow' or 'chat'
 
 # Enhanced Reporting Models
-class ReportMetrics(BaseModel):
+@dataclass(slots=True)
+class ReportMetrics:
     npv: float  # Net Present Value in million USD
     irr: float  # Internal Rate of Return
     payback: float  # Payback period in years
@@ -128,46 +231,94 @@ class ComprehensiveReportRequest(BaseModel):
 
     
 
+# Industry standard cost per MW (USD) - more realistic
+COST_PER_MW = {
+    "solar": 1200000,    # $1.2M per MW
+    "wind": 1800000,     # $1.8M per MW  
+    "hybrid": 1500000,   # $1.5M per MW
+    "hydro": 2500000,    # $2.5M per MW
+}
+
+# Cost-evaluation rates per project type: (CAPEX per MW, annual OPEX per MW) in USD
+PROJECT_COST_RATES = {
+    "solar": (1000000, 15000),
+    "wind": (1500000, 25000),
+}
+DEFAULT_PROJECT_COST_RATES = (1200000, 20000)
+
+# Realistic capacity factors based on resource type
+BASE_CAPACITY_FACTORS = {
+    "solar": 0.18,  # 18% base for solar
+    "wind": 0.32,   # 32% base for wind
+    "hybrid": 0.25, # 25% for hybrid
+    "hydro": 0.45,  # 45% for hydro
+}
+
+# Monthly share of annual generation
+SOLAR_MONTHLY_PATTERN = (0.08, 0.09, 0.10, 0.11, 0.12, 0.12, 0.11, 0.10, 0.09, 0.08, 0.07, 0.07)  # higher in summer
+WIND_MONTHLY_PATTERN = (0.11, 0.10, 0.09, 0.08, 0.07, 0.06, 0.06, 0.07, 0.08, 0.09, 0.10, 0.11)   # higher in winter
+FLAT_MONTHLY_PATTERN = (0.09,) * 12  # hybrid/hydro: more consistent
+MONTHLY_PATTERNS = {"solar": SOLAR_MONTHLY_PATTERN, "wind": WIND_MONTHLY_PATTERN}
+
+# CAPEX split (equipment, installation, grid, development, contingency) and its
+# per-GW scale adjustment: larger projects have a higher equipment share
+CAPEX_RATIOS_BASE = (0.45, 0.25, 0.12, 0.10, 0.08)
+CAPEX_RATIOS_ADJUST = (0.1, -0.05, 0.0, 0.0, 0.0)
+
+# Revenue multiplier for years 1-5 (3% annual growth)
+REVENUE_GROWTH = (1.00, 1.03, 1.06, 1.09, 1.12)
+
+BASE_KEYWORDS = ("renewable energy", "sustainability", "clean technology", "GeoSpark AI")
+RESOURCE_KEYWORDS = {
+    "solar": ("photovoltaic", "solar farm", "PV system", "solar panels"),
+    "wind": ("wind turbine", "wind farm", "turbine technology", "wind power"),
+    "hybrid": ("hybrid system", "energy storage", "battery", "smart grid"),
+    "hydro": ("hydroelectric", "water power", "dam", "turbine"),
+}
+REPORT_KEYWORDS = {
+    "executive": ("strategic", "investment", "business case", "management"),
+    "investor": ("ROI", "financial", "investment thesis", "returns"),
+    "technical": ("engineering", "specifications", "performance", "design"),
+    "environmental": ("sustainability", "carbon", "ESG", "climate"),
+}
+
+def _compose_keywords(resource_type: str, report_type: str) -> tuple:
+    return (BASE_KEYWORDS + RESOURCE_KEYWORDS.get(resource_type, ()) + REPORT_KEYWORDS.get(report_type, ()))[:8]
+
+# Top-8 keywords for every known (resource_type, report_type) pair
+KEYWORD_CACHE = {
+    (rt, rp): _compose_keywords(rt, rp)
+    for rt in RESOURCE_KEYWORDS
+    for rp in REPORT_KEYWORDS
+}
+
 # Enhanced calculation functions for realistic metrics
-def calculate_realistic_metrics(request: ComprehensiveReportRequest) -> ReportMetrics:
-    """Calculate realistic financial and technical metrics based on ACTUAL project parameters"""
-    capacity = request.capacity_mw
-    resource_type = request.resource_type.lower()
+def location_variation(location: Dict[str, float], salt: int = 0) -> float:
+    """Stable pseudo-random value in [0, 1] for a location
     
-    # Industry standard cost per MW (USD) - more realistic
-    cost_per_mw = {
-        "solar": 1200000,    # $1.2M per MW
-        "wind": 1800000,     # $1.8M per MW  
-        "hybrid": 1500000,   # $1.5M per MW
-        "hydro": 2500000,    # $2.5M per MW
-    }
-    
-    # Use provided cost or calculate realistic one
-    if request.estimated_cost and request.estimated_cost >= capacity * 500000:
-        total_capex = request.estimated_cost
-    else:
-        total_capex = capacity * cost_per_mw.get(resource_type, 1200000)
-    
-    # Realistic capacity factors based on resource type and location
-    base_capacity_factors = {
-        "solar": 0.18,  # 18% base for solar
-        "wind": 0.32,   # 32% base for wind
-        "hybrid": 0.25, # 25% for hybrid
-        "hydro": 0.45,  # 45% for hydro
-    }
-    
-    # Add location-based variation (latitude affects solar, etc.)
-    lat = abs(request.location.get('latitude', 0))
-    if resource_type == "solar":
-        # Solar performs better near equator
-        lat_factor = max(0.8, 1.2 - (lat / 45))
-        capacity_factor = base_capacity_factors["solar"] * lat_factor
-    elif resource_type == "wind":
-        # Wind varies less with latitude
-        capacity_factor = base_capacity_factors["wind"] * (0.9 + random.random() * 0.2)
-    else:
-        capacity_factor = base_capacity_factors.get(resource_type, 0.25)
+    Same location, same value, so identical report requests get identical
+    responses. Only numbers go into the hash: str hashes are salted per
+    process and would differ between workers.
+    """
+    key = (round(location.get('latitude', 0), 3), round(location.get('longitude', 0), 3), salt)
+    return (hash(key) & 0xFFFF) / 0xFFFF
+
+def annuity_factor(discount_rate: float, years: int) -> float:
+    """Present value of 1 USD received at the end of each year for `years` years"""
+    if years <= 0:
+        return 0.0
+    if discount_rate == 0:
+        return float(years)
+    return (1.0 - (1.0 + discount_rate) ** -years) / discount_rate
+
+@lru_cache(maxsize=1024)
+def _metrics_core(capacity: float, total_capex: float, capacity_factor: float) -> tuple:
+    """Scalar financial/technical kernel behind calculate_realistic_metrics
     
+    Takes and returns plain floats so it can be called in batch without
+    building request or response models. It is pure, so repeated reports
+    for the same project are served from the cache.
+    """
     # Clamp capacity factor to realistic ranges
     capacity_factor = max(0.15, min(capacity_factor, 0.50))
     
@@ -188,10 +339,10 @@ def calculate_realistic_metrics(request: ComprehensiveReportRequest) -> ReportMe
     project_lifetime = 25
     discount_rate = 0.07
     
+    pv_factor = annuity_factor(discount_rate, project_lifetime)
+    
     # Calculate NPV
-    npv = -total_capex
-    for year in range(1, project_lifetime + 1):
-        npv += (annual_revenue - annual_opex) / ((1 + discount_rate) ** year)
+    npv = -total_capex + (annual_revenue - annual_opex) * pv_factor
     
     # Calculate IRR (simplified)
     if total_capex > 0 and (annual_revenue - annual_opex) > 0:
@@ -210,18 +361,53 @@ def calculate_realistic_metrics(request: ComprehensiveReportRequest) -> ReportMe
     total_generation_mwh = annual_generation_mwh * project_lifetime
     if total_generation_mwh > 0:
         # Present value of costs
-        pv_costs = total_capex + sum(annual_opex / ((1 + discount_rate) ** year) 
-                                   for year in range(1, project_lifetime + 1))
+        pv_costs = total_capex + annual_opex * pv_factor
         lcoe = pv_costs / total_generation_mwh
     else:
         lcoe = 80.0
     
+    return (
+        npv / 1000000,  # Convert to million USD
+        max(0.08, min(irr, 0.25)),  # Realistic IRR range 8-25%
+        float(min(payback, project_lifetime)),
+        float(max(40, min(lcoe, 120))),  # Realistic LCOE range $40-120/MWh
+        annual_generation_gwh,
+        capacity_factor,
+        carbon_reduction,
+    )
+
+def calculate_realistic_metrics(request: ComprehensiveReportRequest) -> ReportMetrics:
+    """Calculate realistic financial and technical metrics based on ACTUAL project parameters"""
+    capacity = request.capacity_mw
+    resource_type = request.resource_type.lower()
+    
+    # Use provided cost or calculate realistic one
+    if request.estimated_cost and request.estimated_cost >= capacity * 500000:
+        total_capex = request.estimated_cost
+    else:
+        total_capex = capacity * COST_PER_MW.get(resource_type, 1200000)
+    
+    # Add location-based variation (latitude affects solar, etc.)
+    lat = abs(request.location.get('latitude', 0))
+    if resource_type == "solar":
+        # Solar performs better near equator
+        lat_factor = max(0.8, 1.2 - (lat / 45))
+        capacity_factor = BASE_CAPACITY_FACTORS["solar"] * lat_factor
+    elif resource_type == "wind":
+        # Wind varies less with latitude
+        capacity_factor = BASE_CAPACITY_FACTORS["wind"] * (0.9 + location_variation(request.location) * 0.2)
+    else:
+        capacity_factor = BASE_CAPACITY_FACTORS.get(resource_type, 0.25)
+    
+    npv, irr, payback, lcoe, annual_generation, capacity_factor, carbon_reduction = _metrics_core(
+        capacity, total_capex, capacity_factor
+    )
     return ReportMetrics(
-        npv=npv / 1000000,  # Convert to million USD
-        irr=max(0.08, min(irr, 0.25)),  # Realistic IRR range 8-25%
-        payback=min(payback, project_lifetime),
-        lcoe=max(40, min(lcoe, 120)),  # Realistic LCOE range $40-120/MWh
-        annual_generation=annual_generation_gwh,
+        npv=npv,
+        irr=irr,
+        payback=payback,
+        lcoe=lcoe,
+        annual_generation=annual_generation,
         capacity_factor=capacity_factor,
         carbon_reduction=carbon_reduction
     )
@@ -231,34 +417,18 @@ def generate_dynamic_charts(request: ComprehensiveReportRequest, metrics: Report
     capacity = request.capacity_mw
     
     # CAPEX breakdown based on actual project scale
-    equipment_ratio = 0.45 + (capacity / 1000) * 0.1  # Larger projects have higher equipment ratio
-    installation_ratio = 0.25 - (capacity / 1000) * 0.05
-    grid_ratio = 0.12
-    development_ratio = 0.10
-    contingency_ratio = 0.08
-    
+    scale = capacity / 1000
     capex_data = [
-        metrics.annual_generation * equipment_ratio * 1000,
-        metrics.annual_generation * installation_ratio * 1000,
-        metrics.annual_generation * grid_ratio * 1000,
-        metrics.annual_generation * development_ratio * 1000,
-        metrics.annual_generation * contingency_ratio * 1000
+        metrics.annual_generation * (base + adjust * scale) * 1000
+        for base, adjust in zip(CAPEX_RATIOS_BASE, CAPEX_RATIOS_ADJUST)
     ]
     
     # Revenue forecast with realistic growth
     base_revenue = metrics.annual_generation * 0.055  # $55/MWh average
-    revenue_forecast = [base_revenue * (1 + 0.03 * i) for i in range(5)]
+    revenue_forecast = [base_revenue * growth for growth in REVENUE_GROWTH]
     
     # Monthly generation with seasonal patterns
-    if request.resource_type == "solar":
-        # Solar: higher in summer months
-        monthly_pattern = [0.08, 0.09, 0.10, 0.11, 0.12, 0.12, 0.11, 0.10, 0.09, 0.08, 0.07, 0.07]
-    elif request.resource_type == "wind":
-        # Wind: often higher in winter
-        monthly_pattern = [0.11, 0.10, 0.09, 0.08, 0.07, 0.06, 0.06, 0.07, 0.08, 0.09, 0.10, 0.11]
-    else:
-        # Hybrid/Hydro: more consistent
-        monthly_pattern = [0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09]
+    monthly_pattern = MONTHLY_PATTERNS.get(request.resource_type, FLAT_MONTHLY_PATTERN)
     
     monthly_generation = [metrics.annual_generation * factor for factor in monthly_pattern]
     
@@ -285,67 +455,63 @@ def generate_dynamic_charts(request: ComprehensiveReportRequest, metrics: Report
         }
     }
 
-def generate_professional_report_content(request: ComprehensiveReportRequest, metrics: ReportMetrics) -> str:
-    """Generate detailed, professional report content with GeoSpark branding"""
-    
-    report_templates = {
-        "executive": f"""
+EXECUTIVE_REPORT_TEMPLATE = """
 GEO SPARK AI - EXECUTIVE SUMMARY REPORT
-Project: {request.project_name}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+Project: {project_name}
+Generated: {generated}
 
 EXECUTIVE OVERVIEW
 ------------------
-{request.project_name} is a {request.capacity_mw} MW {request.resource_type} energy project located in {request.country}. 
-Developed by {request.developer}, this project represents a significant investment in renewable energy infrastructure.
+{project_name} is a {capacity_mw} MW {resource_type} energy project located in {country}. 
+Developed by {developer}, this project represents a significant investment in renewable energy infrastructure.
 
 KEY FINANCIAL METRICS
-• Net Present Value: ${metrics.npv:.1f} Million
-• Internal Rate of Return: {metrics.irr*100:.1f}%
-• Payback Period: {metrics.payback:.1f} Years
-• Levelized Cost of Energy: ${metrics.lcoe:.1f}/MWh
+• Net Present Value: ${npv:.1f} Million
+• Internal Rate of Return: {irr_pct:.1f}%
+• Payback Period: {payback:.1f} Years
+• Levelized Cost of Energy: ${lcoe:.1f}/MWh
 
 TECHNICAL PERFORMANCE
-• Annual Generation: {metrics.annual_generation:.0f} GWh
-• Capacity Factor: {metrics.capacity_factor*100:.1f}%
-• Carbon Reduction: {metrics.carbon_reduction:,.0f} tons CO2/year
+• Annual Generation: {annual_generation:.0f} GWh
+• Capacity Factor: {capacity_factor_pct:.1f}%
+• Carbon Reduction: {carbon_reduction:,.0f} tons CO2/year
 
 STRATEGIC RECOMMENDATIONS
 1. Proceed with project development given strong financial returns
-2. Implement phased construction over {request.timeline_months or 24} months
+2. Implement phased construction over {timeline_months} months
 3. Secure power purchase agreements at competitive rates
-4. Monitor regulatory developments in {request.country}
+4. Monitor regulatory developments in {country}
 
 This project demonstrates excellent viability with robust financial metrics and significant environmental benefits.
 
 ---
 GeoSpark AI Analytics • Confidential Business Report
-        """,
-        
-        "investor": f"""
+        """
+
+INVESTOR_REPORT_TEMPLATE = """
 GEO SPARK AI - INVESTOR REPORT
-Project: {request.project_name}
+Project: {project_name}
 
 INVESTMENT HIGHLIGHTS
-• {request.capacity_mw} MW {request.resource_type} Project in {request.country}
-• NPV: ${metrics.npv:.1f}M | IRR: {metrics.irr*100:.1f}% | Payback: {metrics.payback:.1f} Years
-• Annual Revenue Potential: ${metrics.annual_generation * 55:,.0f}
-• Carbon Credits: {metrics.carbon_reduction:,.0f} tons/year
+• {capacity_mw} MW {resource_type} Project in {country}
+• NPV: ${npv:.1f}M | IRR: {irr_pct:.1f}% | Payback: {payback:.1f} Years
+• Annual Revenue Potential: ${electricity_sales:,.0f}
+• Carbon Credits: {carbon_reduction:,.0f} tons/year
 
 FINANCIAL ANALYSIS
-CAPEX Breakdown: ${request.estimated_cost or metrics.npv*1000000:,.0f}
-- Equipment: {metrics.annual_generation * 0.45:,.0f}
-- Installation: {metrics.annual_generation * 0.25:,.0f}
-- Grid Connection: {metrics.annual_generation * 0.15:,.0f}
+CAPEX Breakdown: ${capex:,.0f}
+- Equipment: {equipment:,.0f}
+- Installation: {installation:,.0f}
+- Grid Connection: {grid_connection:,.0f}
 
 Revenue Streams:
-1. Electricity Sales: ${metrics.annual_generation * 55:,.0f}/year
-2. Carbon Credits: ${metrics.carbon_reduction * 25:,.0f}/year
+1. Electricity Sales: ${electricity_sales:,.0f}/year
+2. Carbon Credits: ${carbon_credits:,.0f}/year
 3. Government Incentives: Available
 
 RISK ASSESSMENT: Low to Moderate
-• Technology Risk: Low ({request.resource_type} is proven)
-• Regulatory Risk: Medium (dependent on {request.country} policies)
+• Technology Risk: Low ({resource_type} is proven)
+• Regulatory Risk: Medium (dependent on {country} policies)
 • Market Risk: Low (growing demand for renewables)
 
 EXIT STRATEGY
@@ -355,30 +521,30 @@ EXIT STRATEGY
 
 ---
 GeoSpark AI Analytics • Investor Confidential
-        """,
-        
-        "technical": f"""
+        """
+
+TECHNICAL_REPORT_TEMPLATE = """
 GEO SPARK AI - TECHNICAL REPORT
-Project: {request.project_name}
+Project: {project_name}
 
 TECHNICAL SPECIFICATIONS
-• Capacity: {request.capacity_mw} MW {request.resource_type}
-• Location: {request.location['latitude']:.4f}°, {request.location['longitude']:.4f}°
-• Annual Generation: {metrics.annual_generation:.0f} GWh
-• Capacity Factor: {metrics.capacity_factor*100:.1f}%
+• Capacity: {capacity_mw} MW {resource_type}
+• Location: {latitude:.4f}°, {longitude:.4f}°
+• Annual Generation: {annual_generation:.0f} GWh
+• Capacity Factor: {capacity_factor_pct:.1f}%
 • System Availability: 98% target
 
 DESIGN PARAMETERS
-{request.resource_type.upper()} SYSTEM CONFIGURATION:
-- Panel/Turbine Efficiency: {85 + random.randint(0,10)}%
+{resource_type_upper} SYSTEM CONFIGURATION:
+- Panel/Turbine Efficiency: {efficiency}%
 - Inverter Efficiency: 98%
 - System Losses: 8-12%
-- Land Requirement: {request.capacity_mw * 5} acres
+- Land Requirement: {land_acres} acres
 
 PERFORMANCE ANALYSIS
 Monthly Generation Profile:
-- Peak: {max(metrics.annual_generation * 0.12, metrics.annual_generation * 0.08):.1f} GWh
-- Average: {metrics.annual_generation / 12:.1f} GWh
+- Peak: {peak_monthly:.1f} GWh
+- Average: {average_monthly:.1f} GWh
 - Capacity Utilization: Excellent
 
 MAINTENANCE SCHEDULE
@@ -388,126 +554,181 @@ MAINTENANCE SCHEDULE
 
 ---
 GeoSpark AI Analytics • Technical Specifications
-        """,
-        
-        "environmental": f"""
+        """
+
+ENVIRONMENTAL_REPORT_TEMPLATE = """
 GEO SPARK AI - ENVIRONMENTAL IMPACT REPORT
-Project: {request.project_name}
+Project: {project_name}
 
 ENVIRONMENTAL BENEFITS
-• Annual CO2 Reduction: {metrics.carbon_reduction:,.0f} tons
-• Equivalent to: {metrics.carbon_reduction / 5:,.0f} cars removed from roads
-• Equivalent Trees Planted: {metrics.carbon_reduction * 22.4:,.0f}
-• Homes Powered: {metrics.annual_generation * 100:,.0f}
+• Annual CO2 Reduction: {carbon_reduction:,.0f} tons
+• Equivalent to: {cars_removed:,.0f} cars removed from roads
+• Equivalent Trees Planted: {trees_planted:,.0f}
+• Homes Powered: {homes_powered:,.0f}
 
 SUSTAINABILITY METRICS
 • Carbon Intensity: 0 g CO2/kWh (vs. 600 g CO2/kWh for natural gas)
-• Water Savings: {metrics.annual_generation * 1000:,.0f} gallons/year vs. thermal generation
+• Water Savings: {water_savings:,.0f} gallons/year vs. thermal generation
 • Land Impact: Minimal (compatible with agricultural use)
 
 COMMUNITY IMPACT
-• Job Creation: {int(request.capacity_mw * 2)} construction jobs, {int(request.capacity_mw * 0.3)} permanent jobs
-• Local Economic Benefits: ${request.capacity_mw * 50000:,.0f}/year in local spending
+• Job Creation: {construction_jobs} construction jobs, {permanent_jobs} permanent jobs
+• Local Economic Benefits: ${local_spending:,.0f}/year in local spending
 • Energy Security: Reduces dependence on imported fuels
 
 COMPLIANCE & CERTIFICATIONS
-• Meets {request.country} renewable energy targets
+• Meets {country} renewable energy targets
 • Eligible for carbon credit programs
 • Aligns with UN Sustainable Development Goals
 
 ---
 GeoSpark AI Analytics • Environmental Impact Assessment
         """
+
+REPORT_TEMPLATES = {
+    "executive": EXECUTIVE_REPORT_TEMPLATE,
+    "investor": INVESTOR_REPORT_TEMPLATE,
+    "technical": TECHNICAL_REPORT_TEMPLATE,
+    "environmental": ENVIRONMENTAL_REPORT_TEMPLATE,
+}
+
+def generate_professional_report_content(request: ComprehensiveReportRequest, metrics: ReportMetrics, now: Optional[datetime] = None) -> str:
+    """Generate detailed, professional report content with GeoSpark branding"""
+    report_type = request.report_type
+    
+    # Fields shared by every template, formatted in a single pass
+    fields = {
+        "project_name": request.project_name,
+        "developer": request.developer,
+        "country": request.country,
+        "capacity_mw": request.capacity_mw,
+        "resource_type": request.resource_type,
+        "npv": metrics.npv,
+        "irr_pct": metrics.irr * 100,
+        "payback": metrics.payback,
+        "lcoe": metrics.lcoe,
+        "annual_generation": metrics.annual_generation,
+        "capacity_factor_pct": metrics.capacity_factor * 100,
+        "carbon_reduction": metrics.carbon_reduction,
+        "generated": (now or datetime.now()).strftime('%Y-%m-%d %H:%M'),
+        "timeline_months": request.timeline_months or 24,
     }
     
-    return report_templates.get(request.report_type, report_templates["executive"])
+    # Template-specific figures are only computed for the selected report
+    if report_type == "investor":
+        fields.update(
+            capex=request.estimated_cost or metrics.npv * 1000000,
+            equipment=metrics.annual_generation * 0.45,
+            installation=metrics.annual_generation * 0.25,
+            grid_connection=metrics.annual_generation * 0.15,
+            electricity_sales=metrics.annual_generation * 55,
+            carbon_credits=metrics.carbon_reduction * 25,
+        )
+    elif report_type == "technical":
+        fields.update(
+            resource_type_upper=request.resource_type.upper(),
+            latitude=request.location['latitude'],
+            longitude=request.location['longitude'],
+            efficiency=85 + round(location_variation(request.location, salt=1) * 10),
+            land_acres=request.capacity_mw * 5,
+            peak_monthly=max(metrics.annual_generation * 0.12, metrics.annual_generation * 0.08),
+            average_monthly=metrics.annual_generation / 12,
+        )
+    elif report_type == "environmental":
+        fields.update(
+            cars_removed=metrics.carbon_reduction / 5,
+            trees_planted=metrics.carbon_reduction * 22.4,
+            homes_powered=metrics.annual_generation * 100,
+            water_savings=metrics.annual_generation * 1000,
+            construction_jobs=int(request.capacity_mw * 2),
+            permanent_jobs=int(request.capacity_mw * 0.3),
+            local_spending=request.capacity_mw * 50000,
+        )
+    
+    return REPORT_TEMPLATES.get(report_type, EXECUTIVE_REPORT_TEMPLATE).format_map(fields)
 
 def generate_keywords(resource_type: str, report_type: str) -> List[str]:
     """Generate relevant keywords for the report"""
-    base_keywords = ["renewable energy", "sustainability", "clean technology", "GeoSpark AI"]
-    resource_keywords = {
-        "solar": ["photovoltaic", "solar farm", "PV system", "solar panels"],
-        "wind": ["wind turbine", "wind farm", "turbine technology", "wind power"],
-        "hybrid": ["hybrid system", "energy storage", "battery", "smart grid"],
-        "hydro": ["hydroelectric", "water power", "dam", "turbine"]
-    }
-    report_keywords = {
-        "executive": ["strategic", "investment", "business case", "management"],
-        "investor": ["ROI", "financial", "investment thesis", "returns"],
-        "technical": ["engineering", "specifications", "performance", "design"],
-        "environmental": ["sustainability", "carbon", "ESG", "climate"]
-    }
-    
-    keywords = base_keywords + resource_keywords.get(resource_type, []) + report_keywords.get(report_type, [])
-    return keywords[:8]  # Return top 8 keywords
+    keywords = KEYWORD_CACHE.get((resource_type, report_type))
+    if keywords is None:
+        keywords = _compose_keywords(resource_type, report_type)
+    return list(keywords)  # Return top 8 keywords
 
 # API Routes
+ROOT_BODY = orjson.dumps({
+    "message": "Welcome to GeoSpark AI Analytics Platform",
+    "version": "2.0.0",
+    "status": "operational",
+    "docs": "/docs"
+})
+
 @app.get("/")
 async def root():
-    return {
-        "message": "Welcome to GeoSpark AI Analytics Platform",
-        "version": "2.0.0",
-        "status": "operational",
-        "docs": "/docs"
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    # now_iso() reformats the timestamp at most once a second
+    return Response(content=orjson.dumps({"status": "healthy", "timestamp": now_iso()}), media_type="application/json")
+
+def _build_report_payload(request: ComprehensiveReportRequest) -> Dict[str, Any]:
+    """Build the comprehensive report response body (pure CPU work, safe to run in a worker thread)"""
+    now = datetime.now()
+    
+    # Calculate realistic metrics based on ALL user inputs
+    metrics = calculate_realistic_metrics(request)
+    
+    # Generate dynamic charts based on actual metrics
+    charts_data = generate_dynamic_charts(request, metrics)
+    
+    # Generate professional report content
+    report_content = generate_professional_report_content(request, metrics, now)
+    
+    # Generate relevant keywords
+    keywords = generate_keywords(request.resource_type, request.report_type)
+    
+    return {
+        "success": True,
+        "report": {
+            "content": report_content,
+            "type": request.report_type,
+            "project": {
+                "name": request.project_name,
+                "location": request.location,
+                "resource_type": request.resource_type,
+                "capacity_mw": request.capacity_mw,
+                "developer": request.developer,
+                "country": request.country,
+                "estimated_cost": request.estimated_cost,
+                "timeline_months": request.timeline_months
+            },
+            "metrics": asdict(metrics),
+            "charts": charts_data,
+            "sentiment": "positive",
+            "keywords": keywords,
+            "generated_at": now.isoformat(),
+            "confidence": 0.95
+        }
+    }
 
 @app.post("/api/v1/comprehensive-report")
 async def generate_comprehensive_report(request: ComprehensiveReportRequest):
     """Generate comprehensive project reports with dynamic metrics and professional content"""
     try:
-        # Calculate realistic metrics based on ALL user inputs
-        metrics = calculate_realistic_metrics(request)
-        
-        # Generate dynamic charts based on actual metrics
-        charts_data = generate_dynamic_charts(request, metrics)
-        
-        # Generate professional report content
-        report_content = generate_professional_report_content(request, metrics)
-        
-        # Generate relevant keywords
-        keywords = generate_keywords(request.resource_type, request.report_type)
-        
-        return JSONResponse({
-            "success": True,
-            "report": {
-                "content": report_content,
-                "type": request.report_type,
-                "project": {
-                    "name": request.project_name,
-                    "location": request.location,
-                    "resource_type": request.resource_type,
-                    "capacity_mw": request.capacity_mw,
-                    "developer": request.developer,
-                    "country": request.country,
-                    "estimated_cost": request.estimated_cost,
-                    "timeline_months": request.timeline_months
-                },
-                "metrics": metrics.dict(),
-                "charts": charts_data,
-                "sentiment": "positive",
-                "keywords": keywords,
-                "generated_at": datetime.now().isoformat(),
-                "confidence": 0.95
-            }
-        })
+        payload = await asyncio.to_thread(_build_report_payload, request)
+        return ORJSONResponse(payload)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
 
-@app.post("/api/v1/site-analysis")
-async def analyze_site(request: SiteAnalysisRequest):
-    """Analyze a site for renewable energy potential"""
+async def _analyze_site_impl(latitude: float, longitude: float, area_km2: float,
+                             project_type: str, analysis_depth: str) -> Dict[str, Any]:
+    """Site analysis shared by the HTTP route and the in-process workflows"""
     try:
-        from demo import SiteAnalysisRequest as DemoRequest
-        
         demo_request = DemoRequest(
-            location=request.location.dict(),
-            project_type=request.project_type,
-            analysis_depth=request.analysis_depth
+            location={"latitude": latitude, "longitude": longitude, "area_km2": area_km2},
+            project_type=project_type,
+            analysis_depth=analysis_depth
         )
         
         result = await demo.analyze_site(demo_request)
@@ -526,30 +747,66 @@ async def analyze_site(request: SiteAnalysisRequest):
                 "recommendations": result.recommendations,
                 "risks": result.risks,
                 "estimated_capacity_mw": result.estimated_capacity_mw,
-                "analysis_timestamp": result.analysis_timestamp.isoformat()
+                # orjson writes datetimes in the same ISO-8601 form as isoformat()
+                "analysis_timestamp": result.analysis_timestamp
             }
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/v1/text-analysis")
-async def analyze_text(request: TextAnalysisRequest):
+@app.post("/api/v1/site-analysis")
+async def analyze_site(request: SiteAnalysisRequest):
+    """Analyze a site for renewable energy potential"""
+    # The payload is already JSON-ready; hand it straight to orjson rather than
+    # letting FastAPI walk it through jsonable_encoder first
+    return ORJSONResponse(await _analyze_site_impl(
+        request.location.latitude,
+        request.location.longitude,
+        request.location.area_km2,
+        request.project_type,
+        request.analysis_depth
+    ))
+
+# Financial assumptions used by the chat and full-analysis workflows
+DEFAULT_FINANCIAL_PARAMS = FinancialParams()
+
+# Upper bound on locations per batch so one request cannot monopolise a worker
+MAX_BATCH_SITES = 100
+
+@app.post("/api/v1/site-analysis/batch")
+async def analyze_sites_batch(request: SiteAnalysisBatchRequest):
+    """Analyze several candidate sites in one request"""
+    if len(request.locations) > MAX_BATCH_SITES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SITES} locations per batch")
+    results = await asyncio.gather(*(
+        _analyze_site_impl(
+            location.latitude,
+            location.longitude,
+            location.area_km2,
+            request.project_type,
+            request.analysis_depth
+        )
+        for location in request.locations
+    ))
+    return ORJSONResponse({"success": True, "analyses": [result["analysis"] for result in results]})
+
+async def _analyze_text_impl(text: str, analysis_type: str) -> Dict[str, Any]:
     """Enhanced text analysis that handles comprehensive reports"""
     try:
-        if request.analysis_type == "comprehensive_report":
+        if analysis_type == "comprehensive_report":
             # Simulate comprehensive report analysis
             return {
                 "success": True,
                 "analysis": {
                     "analysis_type": "comprehensive_report",
-                    "summary": f"COMPREHENSIVE ANALYSIS COMPLETED\n\n{request.text}\n\n---\nThis comprehensive analysis includes financial metrics, technical specifications, and strategic recommendations for the renewable energy project.",
+                    "summary": f"COMPREHENSIVE ANALYSIS COMPLETED\n\n{text}\n\n---\nThis comprehensive analysis includes financial metrics, technical specifications, and strategic recommendations for the renewable energy project.",
                     "sentiment": "positive",
                     "keywords": ["renewable energy", "financial analysis", "technical feasibility", "sustainability"],
                     "confidence": 0.94,
-                    "word_count": len(request.text.split()),
+                    "word_count": len(text.split()),
                     "processed_at": datetime.now().isoformat(),
                     "llm_analysis": {
-                        "summary": f"COMPREHENSIVE ANALYSIS COMPLETED\n\n{request.text}\n\n---\nThis comprehensive analysis includes financial metrics, technical specifications, and strategic recommendations for the renewable energy project.",
+                        "summary": f"COMPREHENSIVE ANALYSIS COMPLETED\n\n{text}\n\n---\nThis comprehensive analysis includes financial metrics, technical specifications, and strategic recommendations for the renewable energy project.",
                         "sentiment": "positive",
                         "keywords": ["renewable energy", "financial analysis", "technical feasibility", "sustainability"]
                     }
@@ -557,23 +814,114 @@ async def analyze_text(request: TextAnalysisRequest):
             }
         else:
             # Use existing analysis logic
-            result = await demo.analyze_text(request.text, request.analysis_type)
+            result = await demo.analyze_text(text, analysis_type)
             return {"success": True, "analysis": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/v1/text-analysis")
+async def analyze_text(request: TextAnalysisRequest):
+    """Enhanced text analysis that handles comprehensive reports"""
+    return ORJSONResponse(await _analyze_text_impl(request.text, request.analysis_type))
+
 @app.post("/api/v1/data-search")
 async def search_data(request: DataSearchRequest):
     """Search renewable energy data"""
-    try:
-        result = await demo.search_data(request.query)
-        return {"success": True, "results": result}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    key = ("data-search", request.query)
+    body = _ttl_cache_get(RESPONSE_CACHE, key)
+    if body is None:
+        try:
+            result = await demo.search_data(request.query)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        body = orjson.dumps({"success": True, "results": result})
+        _ttl_cache_put(RESPONSE_CACHE, key, body, SEARCH_CACHE_TTL, RESPONSE_CACHE_SIZE)
+    return Response(content=body, media_type="application/json")
+
+# Hemisphere-aware month -> season mapping used for resource seasonal factors
+NORTHERN_SEASONS = {
+    "spring": (3, 4, 5),
+    "summer": (6, 7, 8),
+    "fall":   (9, 10, 11),
+    "winter": (12, 1, 2),
+}
+SOUTHERN_SEASONS = {
+    "spring": (9, 10, 11),
+    "summer": (12, 1, 2),
+    "fall":   (3, 4, 5),
+    "winter": (6, 7, 8),
+}
+NEUTRAL_SEASONS = {"spring": 1.0, "summer": 1.0, "fall": 1.0, "winter": 1.0}
+HYBRID_SEASON_KEYS = ("summer", "winter", "spring", "fall")
+
+# Fixed equipment assumptions passed to the resource agent per technology
+# (read-only views: they are shared by every request)
+SOLAR_SYSTEM_DEFAULTS = MappingProxyType({"panel_efficiency": 0.22})
+WIND_SYSTEM_DEFAULTS = MappingProxyType({"turbine_rating_mw": 3.0, "hub_height_m": 100})  # Modern 3MW turbines
+
+# Single-technology estimates: resource type -> (agent method, equipment defaults)
+RESOURCE_ESTIMATORS = {
+    "solar": ("estimate_solar_resource", SOLAR_SYSTEM_DEFAULTS),
+    "wind": ("estimate_wind_resource", WIND_SYSTEM_DEFAULTS),
+}
+SUPPORTED_RESOURCE_TYPES = frozenset(RESOURCE_ESTIMATORS) | {"hybrid"}
+
+def monthly_to_seasonal(monthly: Dict[str, float], lat_for_hemi: float) -> Dict[str, float]:
+    """Convert monthly variation (month_1..month_12) to the seasonal factors expected by the UI"""
+    # Build month index -> value map
+    month_vals = {}
+    for k, v in (monthly or {}).items():
+        if isinstance(k, str) and k.startswith("month_"):
+            try:
+                m = int(k.split("_")[1])
+                month_vals[m] = float(v)
+            except Exception:
+                continue
+    # If already in seasonal form, just return
+    if any(k in monthly for k in ("spring","summer","fall","winter")):
+        return {s: float(monthly.get(s, 1.0)) for s in ("spring","summer","fall","winter")}
+    if not month_vals:
+        return dict(NEUTRAL_SEASONS)
+    seasons = NORTHERN_SEASONS if lat_for_hemi >= 0 else SOUTHERN_SEASONS
+    # Compute means
+    overall = sum(month_vals.values()) / len(month_vals)
+    if overall <= 0:
+        return dict(NEUTRAL_SEASONS)
+    out = {}
+    for name, months in seasons.items():
+        vals = [month_vals[m] for m in months if m in month_vals]
+        mean_v = (sum(vals)/len(vals)) if vals else overall
+        out[name] = max(0.1, min(2.0, mean_v/overall))  # clamp to reasonable range
+    return out
+
+async def _estimate_resources_impl(latitude: float, longitude: float, resource_type: str,
+                                   system_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Resource estimation shared by the HTTP route and the in-process workflows"""
+    # Reject unknown types before any agent or site-analysis work is done
+    if resource_type not in SUPPORTED_RESOURCE_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported resource type: {resource_type}")
+    
+    # Identical inputs hit the same NASA/Open-Meteo data, so serve repeats from cache
+    cache_key = (
+        round(latitude, 4), round(longitude, 4), resource_type,
+        system_config.get("area_km2", 100), system_config.get("peak_power_mw")
+    )
+    cached = _ttl_cache_get(RESOURCE_CACHE, cache_key)
+    if cached:
+        return cached
+    
+    # Concurrent cold requests for the same inputs share one agent run
+    task = RESOURCE_INFLIGHT.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _run_resource_estimation(cache_key, latitude, longitude, resource_type, system_config)
+        )
+        RESOURCE_INFLIGHT[cache_key] = task
+        task.add_done_callback(lambda _: RESOURCE_INFLIGHT.pop(cache_key, None))
+    return await asyncio.shield(task)
 
-@app.post("/api/v1/resource-estimation")
-async def estimate_resources(request: ResourceEstimationRequest):
-    """Resource estimation using real NASA POWER and Open-Meteo APIs via ResourceEstimationAgent."""
+async def _run_resource_estimation(cache_key: tuple, latitude: float, longitude: float, resource_type: str,
+                                   system_config: Dict[str, Any]) -> Dict[str, Any]:
     try:
         # Import the real agents
         from app.agents.communication import AgentCommunicationManager
@@ -586,16 +934,16 @@ async def estimate_resources(request: ResourceEstimationRequest):
         resource_agent = ResourceEstimationAgent(comm_manager)
         
         # Get location data
-        lat = request.location.latitude
-        lon = request.location.longitude
-        rt = request.resource_type
+        lat = latitude
+        lon = longitude
+        rt = resource_type
         
         # Get system configuration (use area from request or default to 100 km²)
-        area_km2 = request.system_config.get("area_km2", 100)
+        area_km2 = system_config.get("area_km2", 100)
         
         # First, get site analysis for capacity estimates unless peak provided
         site_data = None
-        provided_peak = request.system_config.get("peak_power_mw") if request.system_config else None
+        provided_peak = system_config.get("peak_power_mw") if system_config else None
         if provided_peak is None:
             site_data = await site_agent.analyze_location({
                 "latitude": lat,
@@ -604,104 +952,41 @@ async def estimate_resources(request: ResourceEstimationRequest):
                 "project_type": rt
             })
         
-        # Helper: convert monthly variation (month_1..month_12) to seasonal factors expected by UI
-        def monthly_to_seasonal(monthly: Dict[str, float], lat_for_hemi: float) -> Dict[str, float]:
-            # Build month index -> value map
-            month_vals = {}
-            for k, v in (monthly or {}).items():
-                if isinstance(k, str) and k.startswith("month_"):
-                    try:
-                        m = int(k.split("_")[1])
-                        month_vals[m] = float(v)
-                    except Exception:
-                        continue
-            # If already in seasonal form, just return
-            if any(k in monthly for k in ("spring","summer","fall","winter")):
-                return {s: float(monthly.get(s, 1.0)) for s in ("spring","summer","fall","winter")}
-            if not month_vals:
-                return {"spring": 1.0, "summer": 1.0, "fall": 1.0, "winter": 1.0}
-            # Hemisphere-aware season mapping
-            north = lat_for_hemi >= 0
-            if north:
-                seasons = {
-                    "spring": [3,4,5],
-                    "summer": [6,7,8],
-                    "fall":   [9,10,11],
-                    "winter": [12,1,2],
-                }
-            else:
-                # Southern hemisphere swaps
-                seasons = {
-                    "spring": [9,10,11],
-                    "summer": [12,1,2],
-                    "fall":   [3,4,5],
-                    "winter": [6,7,8],
-                }
-            # Compute means
-            all_vals = [v for m,v in month_vals.items()]
-            overall = sum(all_vals)/len(all_vals) if all_vals else 0.0
-            if overall <= 0:
-                return {"spring": 1.0, "summer": 1.0, "fall": 1.0, "winter": 1.0}
-            out = {}
-            for name, months in seasons.items():
-                vals = [month_vals[m] for m in months if m in month_vals]
-                mean_v = (sum(vals)/len(vals)) if vals else overall
-                out[name] = max(0.1, min(2.0, mean_v/overall))  # clamp to reasonable range
-            return out
-
         # Prepare system config based on project type
-        if rt == "solar":
+        if rt in RESOURCE_ESTIMATORS:
+            method_name, defaults = RESOURCE_ESTIMATORS[rt]
             # Use estimated capacity from site analysis
             system_config = {
+                **defaults,
                 "peak_power_mw": float(provided_peak if provided_peak is not None else site_data.estimated_capacity_mw),
-                "panel_efficiency": 0.22,
                 "area_km2": area_km2
             }
             # Call resource estimation agent
-            resource_estimate = await resource_agent.estimate_solar_resource(
-                location_data={"latitude": lat, "longitude": lon},
-                system_config=system_config
-            )
-            seasonal = monthly_to_seasonal(resource_estimate.seasonal_variation, lat)
-            
-        elif rt == "wind":
-            system_config = {
-                "peak_power_mw": float(provided_peak if provided_peak is not None else site_data.estimated_capacity_mw),
-                "turbine_rating_mw": 3.0,  # Modern 3MW turbines
-                "hub_height_m": 100,
-                "area_km2": area_km2
-            }
-            resource_estimate = await resource_agent.estimate_wind_resource(
+            resource_estimate = await getattr(resource_agent, method_name)(
                 location_data={"latitude": lat, "longitude": lon},
                 system_config=system_config
             )
             seasonal = monthly_to_seasonal(resource_estimate.seasonal_variation, lat)
             
-        elif rt == "hybrid":
+        else:  # hybrid
             # For hybrid, estimate both solar and wind
             total_peak = float(provided_peak if provided_peak is not None else site_data.estimated_capacity_mw)
             solar_capacity = total_peak * 0.6  # 60% solar
             wind_capacity = total_peak * 0.4   # 40% wind
             
-            solar_config = {
-                "peak_power_mw": solar_capacity,
-                "panel_efficiency": 0.22,
-                "area_km2": area_km2 * 0.6
-            }
-            wind_config = {
-                "peak_power_mw": wind_capacity,
-                "turbine_rating_mw": 3.0,
-                "hub_height_m": 100,
-                "area_km2": area_km2 * 0.4
-            }
+            solar_config = {**SOLAR_SYSTEM_DEFAULTS, "peak_power_mw": solar_capacity, "area_km2": area_km2 * 0.6}
+            wind_config = {**WIND_SYSTEM_DEFAULTS, "peak_power_mw": wind_capacity, "area_km2": area_km2 * 0.4}
             
-            solar_estimate = await resource_agent.estimate_solar_resource(
-                location_data={"latitude": lat, "longitude": lon},
-                system_config=solar_config
-            )
-            wind_estimate = await resource_agent.estimate_wind_resource(
-                location_data={"latitude": lat, "longitude": lon},
-                system_config=wind_config
+            # The two estimates are independent; fetch them concurrently
+            solar_estimate, wind_estimate = await asyncio.gather(
+                resource_agent.estimate_solar_resource(
+                    location_data={"latitude": lat, "longitude": lon},
+                    system_config=solar_config
+                ),
+                resource_agent.estimate_wind_resource(
+                    location_data={"latitude": lat, "longitude": lon},
+                    system_config=wind_config
+                )
             )
             solar_seasonal = monthly_to_seasonal(solar_estimate.seasonal_variation, lat)
             wind_seasonal = monthly_to_seasonal(wind_estimate.seasonal_variation, lat)
@@ -716,7 +1001,7 @@ async def estimate_resources(request: ResourceEstimationRequest):
                     total_peak
                 ),
                 'peak_power_mw': total_peak,
-                'seasonal_variation': {k: (solar_seasonal.get(k,1.0)+wind_seasonal.get(k,1.0))/2 for k in ['summer','winter','spring','fall']},
+                'seasonal_variation': {k: (solar_seasonal.get(k,1.0)+wind_seasonal.get(k,1.0))/2 for k in HYBRID_SEASON_KEYS},
                 'uncertainty_range': (
                     solar_estimate.uncertainty_range[0] + wind_estimate.uncertainty_range[0],
                     solar_estimate.uncertainty_range[1] + wind_estimate.uncertainty_range[1]
@@ -725,8 +1010,6 @@ async def estimate_resources(request: ResourceEstimationRequest):
                 'data_quality_score': (solar_estimate.data_quality_score + wind_estimate.data_quality_score) / 2
             })()
             seasonal = {k: float(v) for k,v in (resource_estimate.seasonal_variation or {}).items()}
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported resource type: {rt}")
         
         # Convert to dictionary
         estimation = {
@@ -743,40 +1026,55 @@ async def estimate_resources(request: ResourceEstimationRequest):
             "data_quality_score": round(resource_estimate.data_quality_score, 2),
         }
         
-        print(f"✅ Resource estimation using NASA POWER/Open-Meteo: {estimation['annual_generation_gwh']} GWh, CF: {estimation['capacity_factor']}")
+        logger.info(
+            "Resource estimation using NASA POWER/Open-Meteo: %s GWh, CF: %s",
+            estimation["annual_generation_gwh"], estimation["capacity_factor"]
+        )
         
-        return {"success": True, "estimation": estimation, "message": f"{rt.title()} resource estimation completed using real NASA data"}
+        response = {"success": True, "estimation": estimation, "message": f"{rt.title()} resource estimation completed using real NASA data"}
+        _ttl_cache_put(RESOURCE_CACHE, cache_key, response, RESOURCE_CACHE_TTL, RESOURCE_CACHE_SIZE)
+        return response
     
     except Exception as e:
-        print(f"❌ Error in resource estimation: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in resource estimation: %s", e)
         raise HTTPException(status_code=500, detail=f"Resource estimation failed: {str(e)}")
 
-@app.post("/api/v1/cost-evaluation")
-async def evaluate_costs(request: CostEvaluationRequest):
-    project_type = request.project_data.get("project_type", "solar")
-    capacity_mw = float(request.project_data.get("capacity_mw", 100))
-    if project_type == "solar":
-        capex_per_mw = 1000000
-        opex_per_mw = 15000
-    elif project_type == "wind":
-        capex_per_mw = 1500000
-        opex_per_mw = 25000
-    else:
-        capex_per_mw = 1200000
-        opex_per_mw = 20000
+@app.post("/api/v1/resource-estimation")
+async def estimate_resources(request: ResourceEstimationRequest):
+    """Resource estimation using real NASA POWER and Open-Meteo APIs via ResourceEstimationAgent."""
+    return ORJSONResponse(await _estimate_resources_impl(
+        request.location.latitude,
+        request.location.longitude,
+        request.resource_type,
+        request.system_config
+    ))
+
+@lru_cache(maxsize=4096)
+def _cost_core(capacity_mw: float, capex_per_mw: float, opex_per_mw: float, annual_generation_gwh: float,
+               electricity_price: float, project_lifetime: int, discount_rate: float) -> tuple:
+    """Pure cost-evaluation arithmetic; cached since UI retries repeat the same inputs"""
     total_capex = capacity_mw * capex_per_mw
     annual_opex = capacity_mw * opex_per_mw
-    electricity_price = float(request.financial_params.get("electricity_price_usd_mwh", 50))
-    annual_generation_gwh = float(request.project_data.get("annual_generation_gwh", 200))
     annual_revenue = annual_generation_gwh * electricity_price * 1000
-    project_lifetime = int(request.financial_params.get("project_lifetime", 25))
-    discount_rate = float(request.financial_params.get("discount_rate", 0.08))
-    npv = -total_capex
-    for year in range(1, project_lifetime + 1):
-        npv += (annual_revenue - annual_opex) / ((1 + discount_rate) ** year)
+    npv = -total_capex + (annual_revenue - annual_opex) * annuity_factor(discount_rate, project_lifetime)
     irr = (annual_revenue - annual_opex) / total_capex if total_capex else 0
+    payback = (total_capex / (annual_revenue - annual_opex)) if (annual_revenue - annual_opex) else None
+    lcoe = (total_capex / (annual_generation_gwh * project_lifetime)) if (annual_generation_gwh and project_lifetime) else None
+    return total_capex, annual_opex, annual_revenue, npv, irr, payback, lcoe
+
+async def _evaluate_costs_impl(project_data: ProjectData, financial_params: FinancialParams) -> Dict[str, Any]:
+    """Cost evaluation shared by the HTTP route and the in-process workflows"""
+    project_type = project_data.project_type
+    capacity_mw = project_data.capacity_mw
+    capex_per_mw, opex_per_mw = PROJECT_COST_RATES.get(project_type, DEFAULT_PROJECT_COST_RATES)
+    electricity_price = financial_params.electricity_price_usd_mwh
+    annual_generation_gwh = project_data.annual_generation_gwh
+    project_lifetime = financial_params.project_lifetime
+    discount_rate = financial_params.discount_rate
+    total_capex, annual_opex, annual_revenue, npv, irr, payback, lcoe = _cost_core(
+        capacity_mw, capex_per_mw, opex_per_mw, annual_generation_gwh,
+        electricity_price, project_lifetime, discount_rate
+    )
     evaluation_result = {
         "project_type": project_type,
         "capacity_mw": capacity_mw,
@@ -788,12 +1086,77 @@ async def evaluate_costs(request: CostEvaluationRequest):
         "financial_metrics": {
             "net_present_value_usd": npv,
             "internal_rate_of_return": irr,
-            "payback_period_years": (total_capex / (annual_revenue - annual_opex)) if (annual_revenue - annual_opex) else None,
-            "levelized_cost_of_energy_usd_mwh": (total_capex / (annual_generation_gwh * project_lifetime)) if (annual_generation_gwh and project_lifetime) else None,
+            "payback_period_years": payback,
+            "levelized_cost_of_energy_usd_mwh": lcoe,
         },
     }
     return {"success": True, "evaluation": evaluation_result, "message": "Cost evaluation completed"}
 
+@app.post("/api/v1/cost-evaluation")
+async def evaluate_costs(request: CostEvaluationRequest):
+    # Microseconds of arithmetic on a cached kernel: stays async so it runs inline
+    # on the event loop instead of paying a threadpool hop as a plain def would
+    return ORJSONResponse(await _evaluate_costs_impl(request.project_data, request.financial_params))
+
+async def geocode_city(city: str) -> Optional[tuple]:
+    """Resolve a city name to (lat, lon) via Nominatim, with a short-lived in-memory cache"""
+    key = city.lower().strip()
+    cached = _ttl_cache_get(GEOCODE_CACHE, key)
+    if cached is not None:
+        return cached or None
+
+    # Nominatim allows about one request per second; never ask it the same question twice at once
+    task = GEOCODE_INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_geocode(city, key))
+        GEOCODE_INFLIGHT[key] = task
+        task.add_done_callback(lambda _: GEOCODE_INFLIGHT.pop(key, None))
+    return await asyncio.shield(task)
+
+async def _fetch_geocode(city: str, key: str) -> Optional[tuple]:
+    r = await app.state.http.get(
+        "https://nominatim.openstreetmap.org/search",
+        params={"format": "json", "q": city, "limit": 1}
+    )
+    data = orjson.loads(r.content)
+
+    # Unknown cities are cached too (as an empty tuple) so retries don't hit Nominatim again
+    coords = (float(data[0]["lat"]), float(data[0]["lon"])) if data else ()
+    _ttl_cache_put(GEOCODE_CACHE, key, coords, GEOCODE_CACHE_TTL, GEOCODE_CACHE_SIZE)
+    return coords or None
+
+async def _run_chat_workflow(city: str, lat: float, lon: float, resource_type: str) -> Dict[str, Any]:
+    """Site, resource, cost and report workflow for one geocoded location"""
+    results: Dict[str, Any] = {}
+    # Site analysis and resource estimation are independent; run them concurrently
+    site_resp, res_resp = await asyncio.gather(
+        _analyze_site_impl(lat, lon, 100, resource_type, "comprehensive"),
+        _estimate_resources_impl(lat, lon, resource_type, {})
+    )
+    results["site_analysis"] = site_resp.get("analysis")
+    results["resource_estimation"] = res_resp.get("estimation")
+
+    # Simple text-based report using existing text-analysis
+    report_text = (
+        f"Generate a brief project report for {city} ({lat}, {lon}). Resource: {resource_type}. "
+        f"Capacity: {results['site_analysis']['estimated_capacity_mw']} MW. "
+        f"Generation: {results['resource_estimation']['annual_generation_gwh']} GWh."
+    )
+    cost_resp, ta = await asyncio.gather(
+        _evaluate_costs_impl(
+            project_data=ProjectData(
+                project_type=resource_type,
+                capacity_mw=results["site_analysis"]["estimated_capacity_mw"],
+                annual_generation_gwh=results["resource_estimation"]["annual_generation_gwh"]
+            ),
+            financial_params=DEFAULT_FINANCIAL_PARAMS
+        ),
+        _analyze_text_impl(report_text, "report")
+    )
+    results["cost_evaluation"] = cost_resp.get("evaluation")
+    results["report"] = ta.get("analysis")
+    return results
+
 @app.post("/api/v1/agent-chat")
 async def agent_chat(req: AgentChatRequest):
     """Lightweight agent that can answer questions and run workflows based on the prompt.
@@ -807,17 +1170,9 @@ async def agent_chat(req: AgentChatRequest):
     lon = None
     if req.city:
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=10) as client:
-                r = await client.get(
-                    "https://nominatim.openstreetmap.org/search",
-                    params={"format": "json", "q": req.city, "limit": 1},
-                    headers={"User-Agent": "geospark-demo"}  # ✅ required
-                )
-                data = await r.json()  # ✅ must await here
-                if data:
-                    lat = float(data[0]["lat"])
-                    lon = float(data[0]["lon"])
+            coords = await geocode_city(req.city)
+            if coords:
+                lat, lon = coords
         except Exception:
             pass
 
@@ -836,100 +1191,105 @@ async def agent_chat(req: AgentChatRequest):
             max_tokens=800,
             temperature=0.5
         ))
-        return {"success": True, "mode": "chat", "message": response.content}
+        return ORJSONResponse({"success": True, "mode": "chat", "message": response.content})
 
     # If we have coordinates, run the full workflow
-    results: Dict[str, Any] = {}
     if lat is not None and lon is not None and ("analy" in msg or "estimate" in msg or "cost" in msg or "report" in msg):
-        site_resp = await analyze_site(SiteAnalysisRequest(
-            location=Location(latitude=lat, longitude=lon, area_km2=100),
-            project_type=resource_type,
-            analysis_depth="comprehensive"
-        ))
-        results["site_analysis"] = site_resp.get("analysis")
-
-        res_resp = await estimate_resources(ResourceEstimationRequest(
-            location=ResourceLocation(latitude=lat, longitude=lon, area_km2=100),
-            resource_type=resource_type,
-            system_config={}
-        ))
-        results["resource_estimation"] = res_resp.get("estimation")
-
-        cost_resp = await evaluate_costs(CostEvaluationRequest(
-            project_data={
-                "project_type": resource_type,
-                "capacity_mw": results["site_analysis"]["estimated_capacity_mw"],
-                "annual_generation_gwh": results["resource_estimation"]["annual_generation_gwh"],
-            },
-            financial_params={"electricity_price_usd_mwh": 50, "project_lifetime": 25, "discount_rate": 0.08}
-        ))
-        results["cost_evaluation"] = cost_resp.get("evaluation")
-
-        # Simple text-based report using existing text-analysis
-        report_text = (
-            f"Generate a brief project report for {req.city} ({lat}, {lon}). Resource: {resource_type}. "
-            f"Capacity: {results['site_analysis']['estimated_capacity_mw']} MW. "
-            f"Generation: {results['resource_estimation']['annual_generation_gwh']} GWh."
-        )
-        ta = await analyze_text(TextAnalysisRequest(text=report_text, analysis_type="report"))
-        results["report"] = ta.get("analysis")
-
-        return {"success": True, "mode": "workflow", "results": results}
+        results = await _run_chat_workflow(req.city, lat, lon, resource_type)
+        return ORJSONResponse({"success": True, "mode": "workflow", "results": results})
 
     # Otherwise provide a generic informative response using simple rules
     help_text = (
         "You can ask me to analyze a city (e.g., 'Analyze Kandy solar'), estimate resources, "
         "evaluate costs, or generate a report by including a city name."
     )
-    return {"success": True, "mode": "chat", "message": help_text}
+    return ORJSONResponse({"success": True, "mode": "chat", "message": help_text})
 
+# The status routes are not cached: total_analyses and the timestamp change
+# with every analysis. Building them takes microseconds, so they stay async
+# and run inline rather than paying a threadpool hop
 @app.get("/api/v1/system-status")
 async def get_system_status():
     """Get system status"""
     try:
         status = demo.get_system_status()
-        return {"success": True, "status": status}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    return ORJSONResponse({"success": True, "status": status})
 
 @app.get("/api/v1/data-statistics")
 async def get_data_statistics():
     """Get data statistics"""
     try:
         stats = demo.get_data_statistics()
-        return {"success": True, "statistics": stats}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    return ORJSONResponse({"success": True, "statistics": stats})
+
+async def _get_user(username: str) -> Optional[Dict[str, Any]]:
+    """Look up a registered user in the shared store, or the in-memory DB"""
+    store = getattr(app.state, "users_store", None)
+    if store is None:
+        return USERS_DB.get(username)
+    record = await store.get(f"user:{username}")
+    return orjson.loads(record) if record else None
+
+async def _create_user(username: str, record: Dict[str, Any]) -> bool:
+    """Insert a user unless the name is taken; returns False if it already exists"""
+    store = getattr(app.state, "users_store", None)
+    if store is None:
+        # setdefault checks and inserts in one step, so no lock is needed
+        return USERS_DB.setdefault(username, record) is record
+    # SET NX claims the name and writes the whole record in one atomic step
+    return bool(await store.set(f"user:{username}", orjson.dumps(record), nx=True))
 
 # Register endpoint
 @app.post("/api/v1/register")
 async def register_user(request: RegisterRequest):
-    if request.username in USERS_DB:
+    import bcrypt
+    
+    if await _get_user(request.username) is not None:
         raise HTTPException(status_code=400, detail="Username already exists")
     
-    # Hash password
-    hashed_pw = bcrypt.hashpw(request.password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    # Hash password (bcrypt is deliberately slow; keep it off the event loop)
+    password = request.password.encode('utf-8')
+    hashed_pw = (await asyncio.to_thread(bcrypt.hashpw, password, bcrypt.gensalt(rounds=BCRYPT_COST))).decode('utf-8')
     
-    USERS_DB[request.username] = {
+    # Insert is checked again: a concurrent registration may have claimed the
+    # name while the hash was being computed
+    created = await _create_user(request.username, {
         "username": request.username,
         "email": request.email,
         "password": hashed_pw
-    }
+    })
+    if not created:
+        raise HTTPException(status_code=400, detail="Username already exists")
     return {"success": True, "message": "User registered successfully"}
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> bytes:
+    """Sentinel bcrypt hash checked for unknown users so misses cost the same as hits"""
+    import bcrypt
+    return bcrypt.hashpw(b"geospark-dummy-password", bcrypt.gensalt(rounds=BCRYPT_COST))
+
 # Authenticate endpoint
 @app.post("/api/v1/authenticate")
 async def authenticate_user(request: AuthenticationRequest):
-    user = USERS_DB.get(request.username)
-    if not user:
-        raise HTTPException(status_code=401, detail="Invalid credentials")
+    import bcrypt
+    import secrets
+    
+    user = await _get_user(request.username)
     
-    # Verify password
-    if not bcrypt.checkpw(request.password.encode('utf-8'), user["password"].encode('utf-8')):
+    # Always run one bcrypt check, against a sentinel hash for unknown users,
+    # so response time doesn't reveal which usernames exist
+    password = request.password.encode('utf-8')
+    stored = user["password"].encode('utf-8') if user else await asyncio.to_thread(_dummy_password_hash)
+    password_ok = await asyncio.to_thread(bcrypt.checkpw, password, stored)
+    if not user or not password_ok:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Generate token
-    token = str(uuid.uuid4())
+    token = secrets.token_urlsafe(32)
     
     return {
         "success": True,
@@ -950,42 +1310,48 @@ async def full_analysis(request: SiteAnalysisRequest):
     """
     try:
         # --- Site Analysis ---
-        site_resp = await analyze_site(request)
+        site_resp = await _analyze_site_impl(
+            request.location.latitude,
+            request.location.longitude,
+            request.location.area_km2,
+            request.project_type,
+            request.analysis_depth
+        )
         site_analysis = site_resp.get("analysis", {})
 
         # --- Resource Estimation ---
         # Pass the estimated capacity to resource estimation so peak_power_mw matches Site Analysis
-        res_request = ResourceEstimationRequest(
-            location=ResourceLocation(**request.location.model_dump()),  # Pydantic v2
-            resource_type=request.project_type,
-            system_config={
+        res_resp = await _estimate_resources_impl(
+            request.location.latitude,
+            request.location.longitude,
+            request.project_type,
+            {
                 "peak_power_mw": float(site_analysis.get("estimated_capacity_mw", 0) or 0),
                 "area_km2": float(request.location.area_km2)
             }
         )
-        res_resp = await estimate_resources(res_request)
         resource_estimation = res_resp.get("estimation", {})
 
-        # --- Cost Evaluation ---
-        cost_request = CostEvaluationRequest(
-            project_data={
-                "project_type": request.project_type,
-                "capacity_mw": site_analysis.get("estimated_capacity_mw", 0),
-                "annual_generation_gwh": resource_estimation.get("annual_generation_gwh", 0),
-            },
-            financial_params={"electricity_price_usd_mwh": 50, "project_lifetime": 25, "discount_rate": 0.08}
-        )
-        cost_resp = await evaluate_costs(cost_request)
-        cost_evaluation = cost_resp.get("evaluation", {})
-
-        # --- Simple Text Report ---
+        # --- Cost Evaluation + Simple Text Report ---
+        # Both only need the site and resource results, so run them together
         report_text = (
             f"Project report: {request.project_type} project at "
             f"({request.location.latitude}, {request.location.longitude}). "
             f"Capacity: {site_analysis.get('estimated_capacity_mw', 0)} MW. "
             f"Generation: {resource_estimation.get('annual_generation_gwh', 0)} GWh."
         )
-        ta_resp = await analyze_text(TextAnalysisRequest(text=report_text, analysis_type="report"))
+        cost_resp, ta_resp = await asyncio.gather(
+            _evaluate_costs_impl(
+                project_data=ProjectData(
+                    project_type=request.project_type,
+                    capacity_mw=site_analysis.get("estimated_capacity_mw", 0),
+                    annual_generation_gwh=resource_estimation.get("annual_generation_gwh", 0)
+                ),
+                financial_params=DEFAULT_FINANCIAL_PARAMS
+            ),
+            _analyze_text_impl(report_text, "report")
+        )
+        cost_evaluation = cost_resp.get("evaluation", {})
         report_summary = ta_resp.get("analysis", "")
 
         # --- Compose workflow ---
@@ -1010,7 +1376,7 @@ async def full_analysis(request: SiteAnalysisRequest):
 
 
         # --- Return workflow ---
-        return {"success": True, "workflow": workflow}
+        return ORJSONResponse({"success": True, "workflow": workflow})
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Full analysis failed: {str(e)}")
@@ -1021,7 +1387,7 @@ async def full_analysis(request: SiteAnalysisRequest):
 
 @app.get("/api/v1/recent-activities")
 async def get_recent_activities():
-    return {"success": True, "activities": RECENT_ACTIVITIES}
+    return ORJSONResponse({"success": True, "activities": RECENT_ACTIVITIES})
 
 
 
@@ -1029,4 +1395,17 @@ async def get_recent_activities():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    import uvicorn
+    
+    # Users, recent activities and result caches live in process memory, so the
+    # default stays at one worker; raise WEB_CONCURRENCY (the variable gunicorn_conf.py
+    # also reads) once those are externalised.
+    # uvicorn picks uvloop/httptools automatically when uvicorn[standard] is installed.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        access_log=False
+    )
\ No newline at end of file
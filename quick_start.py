@@ -28,17 +28,22 @@ def install_dependencies():
         # Install basic dependencies for demo
         basic_deps = [
             "fastapi",
-            "uvicorn",
+            "uvicorn[standard]",
             "pydantic",
+            "orjson",
             "python-multipart",
             "python-jose[cryptography]",
             "passlib[bcrypt]",
             "python-dotenv"
         ]
         
-        for dep in basic_deps:
-            print(f"Installing {dep}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", dep])
+        # One pip run resolves everything together instead of restarting pip per package
+        print(f"Installing {', '.join(basic_deps)}...")
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install",
+            "--no-input", "--disable-pip-version-check",
+            *basic_deps
+        ])
         
         print("✅ Dependencies installed successfully")
         return True
@@ -63,6 +68,8 @@ PORT=8000
 SECRET_KEY=demo_secret_key_change_in_production
 ALGORITHM=HS256
 ACCESS_TOKEN_EXPIRE_MINUTES=30
+# bcrypt work factor; each step doubles hashing time (use 12+ in production)
+BCRYPT_COST=10
 
 # Database (using SQLite for demo)
 DATABASE_URL=sqlite:///./geospark_demo.db
@@ -99,23 +106,27 @@ GeoSpark - Simplified Demo Version
 Run this with: python main.py
 """
 
+import os
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any, List
 import json
 import asyncio
-from datetime import datetime
-import uuid
+import hmac
+import secrets
 
 # Import the demo functionality
-from demo import GeoSparkDemo
+from demo import GeoSparkDemo, SiteAnalysisRequest as DemoRequest, now_iso
 
 app = FastAPI(
     title="GeoSpark Demo API",
     description="AI-powered renewable energy analysis platform - Demo Version",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -127,6 +138,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses such as search results
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize demo
 demo = GeoSparkDemo()
 
@@ -149,6 +163,13 @@ class DataSearchRequest(BaseModel):
     query: str
     limit: int = 5
 
+DEMO_USER = {
+    "id": "1",
+    "username": "demo",
+    "email": "demo@geospark.com",
+    "role": "user"
+}
+
 # API Routes
 @app.get("/")
 async def root():
@@ -161,16 +182,14 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": now_iso()}
 
 @app.post("/api/v1/site-analysis")
 async def analyze_site(request: SiteAnalysisRequest):
     """Analyze a site for renewable energy potential"""
     try:
-        from demo import SiteAnalysisRequest as DemoRequest
-        
         demo_request = DemoRequest(
-            location=request.location.dict(),
+            location=request.location.model_dump(),
             project_type=request.project_type,
             analysis_depth=request.analysis_depth
         )
@@ -239,20 +258,17 @@ async def authenticate(credentials: Dict[str, str]):
     username = credentials.get("username", "")
     password = credentials.get("password", "")
     
-    # Demo credentials
-    if username == "demo" and password == "demo123":
-        return {
-            "success": True,
-            "token": "demo_token_" + str(uuid.uuid4()),
-            "user": {
-                "id": "1",
-                "username": username,
-                "email": f"{username}@geospark.com",
-                "role": "user"
-            }
-        }
-    else:
+    # Demo credentials; compare both in constant time so timing reveals nothing
+    username_ok = hmac.compare_digest(username.encode("utf-8"), b"demo")
+    password_ok = hmac.compare_digest(password.encode("utf-8"), b"demo123")
+    if not (username_ok & password_ok):
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    
+    return {
+        "success": True,
+        "token": "demo_token_" + secrets.token_urlsafe(32),
+        "user": DEMO_USER
+    }
 
 if __name__ == "__main__":
     print("🚀 Starting GeoSpark Demo API...")
@@ -261,19 +277,25 @@ if __name__ == "__main__":
     print("Health Check: http://localhost:8000/health")
     print("=" * 40)
     
+    # Analysis history (behind total_analyses) and the site-result caches live in
+    # process memory, so the default stays at one worker like gunicorn_conf.py
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
         log_level="info"
     )
 '''
     
-    with open("main.py", "w") as f:
-        f.write(main_content)
-    
-    print("✅ Created simplified main.py")
+    # Never clobber the full API server with the demo copy
+    main_file = Path("main.py")
+    if not main_file.exists():
+        with open(main_file, "w") as f:
+            f.write(main_content)
+        print("✅ Created simplified main.py")
+    else:
+        print("ℹ️ main.py already exists")
 
 def run_demo():
     """Run the demo"""
@@ -297,8 +319,14 @@ def run_api():
     print("Press Ctrl+C to stop")
     print("=" * 40)
     
+    # PROD=1 serves through gunicorn (see gunicorn_conf.py for worker settings)
+    if os.getenv("PROD") == "1":
+        command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn_conf.py", "main:app"]
+    else:
+        command = [sys.executable, "main.py"]
+    
     try:
-        subprocess.run([sys.executable, "main.py"])
+        subprocess.run(command)
     except KeyboardInterrupt:
         print("\n👋 API server stopped by user")
     except Exception as e:
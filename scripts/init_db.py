@@ -12,22 +12,29 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.asyncio import create_async_engine
-import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import text
 
 from app.core.config import settings
 from app.core.database import Base, engine
 from app.models import *
 
+# Precomputed bcrypt hash of "demo123"; seeding reuses it instead of paying
+# for a fresh bcrypt round per row
+DEMO_PASSWORD_HASH = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj4J/8Kz8KzK"
+
 async def create_database():
     """Create the database if it doesn't exist"""
     try:
-        # Parse database URL to get connection details
-        db_url = settings.DATABASE_URL
-        if db_url.startswith('postgresql://'):
-            db_url = db_url.replace('postgresql://', 'postgresql+psycopg2://')
+        # Only needed here, so keep the driver import off the other code paths
+        import psycopg2
+        from psycopg2 import sql
+        from psycopg2.errors import DuplicateDatabase
+        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+        
+        # Parse database URL to get connection details; libpq takes plain
+        # postgresql:// URIs, so drop any SQLAlchemy driver suffix
+        scheme, _, rest = settings.DATABASE_URL.partition('://')
+        db_url = f"{scheme.split('+')[0]}://{rest}"
         
         # Extract database name
         db_name = db_url.split('/')[-1]
@@ -35,21 +42,28 @@ async def create_database():
         
         print(f"Creating database: {db_name}")
         
-        # Connect to PostgreSQL server (not specific database)
-        server_url = base_url.replace(db_name, 'postgres')
-        server_engine = create_engine(server_url)
-        
-        with server_engine.connect() as conn:
-            # Check if database exists
-            result = conn.execute(text(f"SELECT 1 FROM pg_database WHERE datname = '{db_name}'"))
-            if result.fetchone():
+        # Two statements need no engine or pool: a raw connection to the
+        # maintenance database is enough. CREATE DATABASE cannot run inside a
+        # transaction block, hence autocommit
+        conn = psycopg2.connect(dsn=f"{base_url}/postgres")
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        cur = conn.cursor()
+        try:
+            # Check first: PostgreSQL tests the CREATEDB privilege before the name,
+            # so a role that owns the database but can't create one would fail here
+            cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (db_name,))
+            if cur.fetchone():
                 print(f"Database '{db_name}' already exists")
             else:
-                # Create database
-                conn.execute(text(f"CREATE DATABASE {db_name}"))
-                print(f"Database '{db_name}' created successfully")
-        
-        server_engine.dispose()
+                try:
+                    cur.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(db_name)))
+                    print(f"Database '{db_name}' created successfully")
+                except DuplicateDatabase:
+                    # Created concurrently since the check
+                    print(f"Database '{db_name}' already exists")
+        finally:
+            cur.close()
+            conn.close()
         
     except Exception as e:
         print(f"Error creating database: {e}")
@@ -58,47 +72,44 @@ async def create_database():
     
     return True
 
-async def create_tables():
-    """Create all database tables"""
+async def create_extension(conn, name: str) -> bool:
+    """Enable a PostgreSQL extension inside its own savepoint
+    
+    A failed CREATE EXTENSION would otherwise abort the surrounding
+    transaction and take the table creation down with it.
+    """
     try:
-        print("Creating database tables...")
-        
-        # Create all tables
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        
-        print("Database tables created successfully")
+        async with conn.begin_nested():
+            await conn.execute(text(f'CREATE EXTENSION IF NOT EXISTS "{name}"'))
         return True
-        
     except Exception as e:
-        print(f"Error creating tables: {e}")
+        print(f"Warning: Could not enable {name} extension: {e}")
         return False
 
-async def create_extensions():
-    """Create PostgreSQL extensions"""
+async def create_schema():
+    """Create PostgreSQL extensions and all tables in a single transaction"""
     try:
-        print("Creating PostgreSQL extensions...")
+        print("Creating PostgreSQL extensions and database tables...")
         
         async with engine.begin() as conn:
             # Enable PostGIS extension
-            try:
-                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+            if await create_extension(conn, "postgis"):
                 print("PostGIS extension enabled")
-            except Exception as e:
-                print(f"Warning: Could not enable PostGIS extension: {e}")
+            else:
                 print("Make sure PostGIS is installed: sudo apt-get install postgis")
             
             # Enable UUID extension
-            try:
-                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS \"uuid-ossp\""))
+            if await create_extension(conn, "uuid-ossp"):
                 print("UUID extension enabled")
-            except Exception as e:
-                print(f"Warning: Could not enable UUID extension: {e}")
+            
+            # Create all tables
+            await conn.run_sync(Base.metadata.create_all)
         
+        print("Database tables created successfully")
         return True
         
     except Exception as e:
-        print(f"Error creating extensions: {e}")
+        print(f"Error creating schema: {e}")
         return False
 
 async def insert_sample_data():
@@ -106,7 +117,6 @@ async def insert_sample_data():
     try:
         print("Inserting sample data...")
         
-        from sqlalchemy.ext.asyncio import AsyncSession
         from app.core.database import async_session_maker
         
         async with async_session_maker() as session:
@@ -118,7 +128,7 @@ async def insert_sample_data():
                 id=uuid.uuid4(),
                 username="demo_user",
                 email="demo@geospark.com",
-                hashed_password="$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj4J/8Kz8KzK",  # "demo123"
+                hashed_password=DEMO_PASSWORD_HASH,
                 full_name="Demo User",
                 organization="GeoSpark Demo",
                 role="user",
@@ -156,19 +166,13 @@ async def main():
     
     print()
     
-    # Step 2: Create extensions
-    if not await create_extensions():
-        return False
-    
-    print()
-    
-    # Step 3: Create tables
-    if not await create_tables():
+    # Step 2: Create extensions and tables
+    if not await create_schema():
         return False
     
     print()
     
-    # Step 4: Insert sample data
+    # Step 3: Insert sample data
     if not await insert_sample_data():
         return False
     
@@ -6,12 +6,33 @@ Redis setup and testing script for GeoSpark
 import redis
 import json
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-def test_redis_connection(redis_url: str = "redis://localhost:6379/0") -> bool:
+# Namespace for the keys this script owns, so setup never touches other data in the database
+KEY_PREFIX = "geospark:"
+
+def clear_geospark_keys(r: redis.Redis, batch_size: int = 500) -> int:
+    """Remove this script's keys incrementally with SCAN + UNLINK instead of FLUSHDB"""
+    removed = 0
+    batch = []
+    for key in r.scan_iter(match=f"{KEY_PREFIX}*", count=1000):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            removed += r.unlink(*batch)
+            batch.clear()
+    if batch:
+        removed += r.unlink(*batch)
+    return removed
+
+def get_redis_client(redis_url: str = "redis://localhost:6379/0") -> redis.Redis:
+    """Create a Redis client; share one between the setup steps so they reuse its connection"""
+    return redis.from_url(redis_url, socket_keepalive=True, health_check_interval=30)
+
+def test_redis_connection(redis_url: str = "redis://localhost:6379/0",
+                          client: Optional[redis.Redis] = None) -> bool:
     """Test Redis connection"""
     try:
-        r = redis.from_url(redis_url)
+        r = client or get_redis_client(redis_url)
         r.ping()
         print("✅ Redis connection successful")
         return True
@@ -19,14 +40,15 @@ def test_redis_connection(redis_url: str = "redis://localhost:6379/0") -> bool:
         print(f"❌ Redis connection failed: {e}")
         return False
 
-def setup_redis_data(redis_url: str = "redis://localhost:6379/0") -> bool:
+def setup_redis_data(redis_url: str = "redis://localhost:6379/0",
+                     client: Optional[redis.Redis] = None) -> bool:
     """Set up initial Redis data"""
     try:
-        r = redis.from_url(redis_url)
+        r = client or get_redis_client(redis_url)
         
         # Clear existing data
-        r.flushdb()
-        print("🗑️ Cleared existing Redis data")
+        removed = clear_geospark_keys(r)
+        print(f"🗑️ Cleared {removed} existing GeoSpark keys")
         
         # Set up sample cache data
         sample_data = {
@@ -53,14 +75,13 @@ def setup_redis_data(redis_url: str = "redis://localhost:6379/0") -> bool:
             }
         }
         
-        # Store sample data
-        for key, value in sample_data.items():
-            r.set(key, json.dumps(value))
+        # Store sample data in one round trip
+        r.mset({f"{KEY_PREFIX}{key}": json.dumps(value, separators=(",", ":")) for key, value in sample_data.items()})
         
         print("✅ Sample Redis data created")
         
         # Test data retrieval
-        cached_data = r.get("site_analysis_cache")
+        cached_data = r.get(f"{KEY_PREFIX}site_analysis_cache")
         if cached_data:
             data = json.loads(cached_data)
             print(f"✅ Data retrieval test successful: {len(data)} entries")
@@ -76,8 +97,10 @@ def main():
     print("🚀 Redis Setup for GeoSpark")
     print("=" * 30)
     
+    client = get_redis_client()
+    
     # Test connection
-    if not test_redis_connection():
+    if not test_redis_connection(client=client):
         print("\n❌ Redis setup failed")
         print("Please make sure Redis is installed and running:")
         print("- Ubuntu/Debian: sudo apt-get install redis-server")
@@ -88,7 +111,7 @@ def main():
     print()
     
     # Set up data
-    if not setup_redis_data():
+    if not setup_redis_data(client=client):
         return False
     
     print()